@@ -7,11 +7,20 @@ and validates it works without breaking existing functionality.
 """
 
 from example_workflows.feature_development.phases import (
-    FEATURE_DEV_PHASES,
     FEATURE_DEV_CONFIG,
     FEATURE_DEV_LAUNCH_TEMPLATE,
 )
 
+
+def __getattr__(name):
+    # Defer loading the phase modules until FEATURE_DEV_PHASES is used
+    if name == "FEATURE_DEV_PHASES":
+        from example_workflows.feature_development import phases
+
+        return phases.FEATURE_DEV_PHASES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "FEATURE_DEV_PHASES",
     "FEATURE_DEV_CONFIG",
@@ -7,11 +7,18 @@ to match Hephaestus's embedding model (gemini-embedding-001, 3072-dim).
 
 import os
 import sys
+import abc
 import asyncio
-from typing import List, Dict, Any
-from qdrant_client import QdrantClient
+import atexit
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from typing import List, Dict, Any, Awaitable, Callable, Optional, Tuple
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
 from fastmcp import FastMCP
-from langchain_google_vertexai import VertexAIEmbeddings
+from google import genai
+from google.genai.types import EmbedContentConfig, HttpOptions, HttpRetryOptions
 
 # Initialize FastMCP
 mcp = FastMCP("Qdrant with Vertex AI Embeddings")
@@ -22,29 +29,302 @@ COLLECTION_NAME = os.getenv("COLLECTION_NAME", "hephaestus_agent_memories")
 GOOGLE_CLOUD_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT", "test-ds-research")
 GOOGLE_CLOUD_LOCATION = os.getenv("GOOGLE_CLOUD_LOCATION", "global")
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "gemini-embedding-001")
+EMBEDDING_DIMENSION = int(os.getenv("EMBEDDING_DIMENSION", "3072"))
+
+# Embedding batching / caching
+MAX_BATCH = 32  # Max texts per Vertex AI call
+FLUSH_MS = 10  # How long to wait for more texts before flushing a batch
+EMBEDDING_CACHE_SIZE = 1024  # Number of recent embeddings kept in memory
+# Upper bound on characters sent; Vertex truncates to the model's exact token limit
+EMBEDDING_MAX_CHARS = 8000
+EMBEDDING_MAX_ATTEMPTS = 3  # Including the first request (429/5xx are retried)
+# Models that take fewer texts per embed_content request than MAX_BATCH on
+# Vertex AI; gemini-embedding-001 accepts a single input per request
+EMBEDDING_MODEL_MAX_INPUTS = {"gemini-embedding-001": 1}
+
+# Qdrant write batching
+UPSERT_BATCH = 64  # Max points per upsert
+UPSERT_FLUSH_MS = 20  # How long to wait for more points before upserting
+
+# Search tuning
+HNSW_EF = int(os.getenv("QDRANT_HNSW_EF", "64"))  # Higher = better recall, slower
+SEARCH_PAYLOAD_FIELDS = ["content", "text", "memory_type"]  # Fields the formatter reads
+RESCORE_OVERSAMPLING = 2.0  # Candidates fetched per result before FP32 rescoring
+METADATA_TTL_SECONDS = 5.0  # How long collection metadata is reused
+
+# Store vectors as int8 in RAM; originals stay on disk for rescoring
+QUANTIZATION_CONFIG = models.ScalarQuantization(
+    scalar=models.ScalarQuantizationConfig(
+        type=models.ScalarType.INT8,
+        quantile=0.99,
+        always_ram=True,
+    )
+)
 
 # Initialize clients
-qdrant_client = QdrantClient(url=QDRANT_URL)
-embeddings_client = VertexAIEmbeddings(
-    model_name=EMBEDDING_MODEL,
+qdrant_client = AsyncQdrantClient(url=QDRANT_URL)
+# A single google-genai client (the one VertexAIEmbeddings wraps) so every
+# embedding request reuses its pooled keep-alive connections
+embeddings_client = genai.Client(
+    vertexai=True,
     project=GOOGLE_CLOUD_PROJECT,
-    location=GOOGLE_CLOUD_LOCATION
+    location=GOOGLE_CLOUD_LOCATION,
+    http_options=HttpOptions(
+        retry_options=HttpRetryOptions(attempts=EMBEDDING_MAX_ATTEMPTS)
+    ),
 )
 
 
+class _Batcher(abc.ABC):
+    """Coalesce concurrent requests into batched calls.
+
+    Items submitted within flush_ms of each other (up to max_batch) are
+    handed to _process together; each caller awaits its own result.
+    """
+
+    def __init__(self, max_batch: int, flush_ms: int):
+        self._max_batch = max_batch
+        self._flush_seconds = flush_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # The batch _process is currently handling, if any
+        self._in_flight: List[Tuple[Any, asyncio.Future]] = []
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result."""
+        if self._worker is None or self._worker.done():
+            # Created lazily so the queue binds to the running loop
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    @abc.abstractmethod
+    async def _process(self, items: List[Any]) -> List[Any]:
+        """Handle one batch, returning one result per item."""
+
+    async def _collect_batch(self) -> List[Tuple[Any, asyncio.Future]]:
+        """Wait for one request, then gather more until full or flush_ms passes."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self._flush_seconds
+
+        while len(batch) < self._max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self):
+        """Background worker draining the queue in batches."""
+        while True:
+            batch = await self._collect_batch()
+
+            self._in_flight = batch
+            try:
+                results = await self._process([item for item, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            finally:
+                self._in_flight = []
+
+            if len(results) != len(batch):
+                # Results can't be matched to callers, so fail them all
+                # rather than leave some waiting forever
+                error = RuntimeError(
+                    f"{type(self).__name__} got {len(results)} results for {len(batch)} items"
+                )
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+class EmbeddingBatcher(_Batcher):
+    """Send concurrent embedding requests in as few Vertex AI calls as the model allows."""
+
+    def __init__(self, client: genai.Client, model: str = EMBEDDING_MODEL,
+                 max_batch: int = MAX_BATCH, flush_ms: int = FLUSH_MS):
+        super().__init__(max_batch, flush_ms)
+        self._client = client
+        self._model = model
+        self._max_inputs = EMBEDDING_MODEL_MAX_INPUTS.get(model, max_batch)
+
+    async def _process(self, texts: List[str]) -> List[List[float]]:
+        # Split the batch to the model's per-request input limit and send
+        # the requests concurrently
+        size = self._max_inputs
+        responses = await asyncio.gather(*(
+            self._embed(texts[start:start + size])
+            for start in range(0, len(texts), size)
+        ))
+        return [embedding.values for response in responses for embedding in response.embeddings]
+
+    async def _embed(self, texts: List[str]) -> Any:
+        # Use the native async API; RETRIEVAL_QUERY matches the vectors
+        # Hephaestus produces with VertexAIEmbeddings.embed_query
+        return await self._client.aio.models.embed_content(
+            model=self._model,
+            contents=texts,
+            config=EmbedContentConfig(
+                task_type="RETRIEVAL_QUERY",
+                auto_truncate=True,
+            ),
+        )
+
+
+class QdrantUpsertBatcher(_Batcher):
+    """Send concurrent point writes as one Qdrant upsert."""
+
+    def __init__(self, client: AsyncQdrantClient, collection_name: str,
+                 max_batch: int = UPSERT_BATCH, flush_ms: int = UPSERT_FLUSH_MS):
+        super().__init__(max_batch, flush_ms)
+        self._client = client
+        self._collection_name = collection_name
+
+    async def _process(self, points: List[Any]) -> List[Any]:
+        # Wait for Qdrant to apply the write so callers only see success
+        # (or the error) once it is actually stored
+        await self._client.upsert(
+            collection_name=self._collection_name,
+            points=points,
+            wait=True,
+        )
+        return [point.id for point in points]
+
+    def flush_pending(self):
+        """Synchronously write any points not yet stored (e.g. at interpreter exit).
+
+        This covers the batch the worker was sending as well as anything
+        still queued. Upserts are idempotent per point ID, so resending an
+        in-flight batch that did reach Qdrant is harmless.
+        """
+        if self._queue is None:
+            return
+
+        pending = [entry for entry in self._in_flight if not entry[1].done()]
+        self._in_flight = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        if not pending:
+            return
+
+        # The event loop is gone by now, so use a short-lived sync client
+        error: Optional[Exception] = None
+        try:
+            QdrantClient(url=QDRANT_URL).upsert(
+                collection_name=self._collection_name,
+                points=[point for point, _ in pending],
+                wait=True,
+            )
+        except Exception as e:
+            error = e
+
+        for point, future in pending:
+            if future.done():
+                continue
+            try:
+                if error is None:
+                    future.set_result(point.id)
+                else:
+                    future.set_exception(error)
+            except RuntimeError:
+                # The future is resolved, but its loop is closed so no
+                # waiter is left to notify
+                pass
+
+        if error is not None:
+            raise error
+
+
+batcher = EmbeddingBatcher(embeddings_client)
+upsert_batcher = QdrantUpsertBatcher(qdrant_client, COLLECTION_NAME)
+atexit.register(upsert_batcher.flush_pending)
+
+
+class _TTLCache:
+    """Short-lived cache for Qdrant metadata lookups.
+
+    A per-key lock ensures concurrent callers share one refetch on expiry.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self._ttl = ttl_seconds
+        self._entries: Dict[tuple, Tuple[float, Any]] = {}
+        self._locks: Dict[tuple, asyncio.Lock] = {}
+
+    def _get_fresh(self, key: tuple) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._ttl:
+            return True, entry[1]
+        return False, None
+
+    async def get_or_fetch(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, calling fetch() if stale or missing."""
+        hit, value = self._get_fresh(key)
+        if hit:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed it while we waited
+            hit, value = self._get_fresh(key)
+            if hit:
+                return value
+
+            value = await fetch()
+            self._entries[key] = (time.monotonic(), value)
+            return value
+
+
+metadata_cache = _TTLCache(METADATA_TTL_SECONDS)
+
+# LRU cache of recent embeddings keyed on the SHA256 of the truncated text
+_embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+
+
 async def generate_embedding(text: str) -> List[float]:
     """Generate embedding using Vertex AI."""
-    # Limit input length and use async embedding
-    truncated_text = text[:8000]
-    # VertexAIEmbeddings doesn't have native async, so we run in executor
-    loop = asyncio.get_event_loop()
-    embedding = await loop.run_in_executor(
-        None,
-        lambda: embeddings_client.embed_query(truncated_text)
-    )
+    # Limit input length
+    truncated_text = text[:EMBEDDING_MAX_CHARS]
+
+    cache_key = hashlib.sha256(truncated_text.encode("utf-8")).hexdigest()
+    cached = _embedding_cache.get(cache_key)
+    if cached is not None:
+        _embedding_cache.move_to_end(cache_key)
+        return cached
+
+    embedding = await batcher.submit(truncated_text)
+
+    _embedding_cache[cache_key] = embedding
+    if len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+        _embedding_cache.popitem(last=False)
     return embedding
 
 
+def _format_result(rank: int, result: Any) -> str:
+    """Format a single search hit, truncating content to 500 characters."""
+    payload = result.payload or {}
+    content = payload.get("content") or payload.get("text") or "No content"
+    memory_type = payload.get("memory_type", "unknown")
+    ellipsis = "..." if len(content) > 500 else ""
+    return f"{rank}. [Score: {result.score:.3f}] [{memory_type}]\n   {content[:500]}{ellipsis}"
+
+
 @mcp.tool()
 async def qdrant_find(query: str, limit: int = 5) -> str:
     """Search for relevant information in Qdrant using semantic search.
@@ -60,32 +340,28 @@ async def qdrant_find(query: str, limit: int = 5) -> str:
         # Generate embedding for query
         query_embedding = await generate_embedding(query)
 
-        # Search in Qdrant
-        results = qdrant_client.search(
+        # Search in Qdrant, fetching only the payload fields we format
+        results = (await qdrant_client.query_points(
             collection_name=COLLECTION_NAME,
-            query_vector=query_embedding,
+            query=query_embedding,
             limit=limit,
-            with_payload=True
-        )
+            with_payload=models.PayloadSelectorInclude(include=SEARCH_PAYLOAD_FIELDS),
+            search_params=models.SearchParams(
+                hnsw_ef=HNSW_EF,
+                exact=False,
+                quantization=models.QuantizationSearchParams(
+                    rescore=True,
+                    oversampling=RESCORE_OVERSAMPLING,
+                ),
+            ),
+        )).points
 
         if not results:
             return "No relevant memories found."
 
-        # Format results
-        formatted_results = []
-        for i, result in enumerate(results, 1):
-            payload = result.payload or {}
-            content = payload.get("content", payload.get("text", "No content"))
-            memory_type = payload.get("memory_type", "unknown")
-            score = result.score
-
-            formatted_results.append(
-                f"{i}. [Score: {score:.3f}] [{memory_type}]\n   {content[:500]}..."
-                if len(content) > 500 else
-                f"{i}. [Score: {score:.3f}] [{memory_type}]\n   {content}"
-            )
-
-        return "\n\n".join(formatted_results)
+        return "\n\n".join(
+            _format_result(i, result) for i, result in enumerate(results, 1)
+        )
 
     except Exception as e:
         return f"Error searching Qdrant: {str(e)}"
@@ -103,31 +379,25 @@ async def qdrant_store(content: str, memory_type: str = "discovery", tags: list
     Returns:
         Confirmation message with the stored point ID
     """
-    import uuid
-    from qdrant_client.models import PointStruct
-
     try:
         # Generate embedding
         embedding = await generate_embedding(content)
 
-        # Create point
-        point_id = str(uuid.uuid4())
-        point = PointStruct(
+        # Create point (fields are already well-typed, so skip pydantic validation)
+        point_id = uuid.uuid4().hex
+        point = models.PointStruct.model_construct(
             id=point_id,
             vector=embedding,
             payload={
                 "content": content,
                 "memory_type": memory_type,
                 "tags": tags or [],
-                "created_at": asyncio.get_event_loop().time()
+                "created_at": time.time()
             }
         )
 
-        # Upsert to Qdrant
-        qdrant_client.upsert(
-            collection_name=COLLECTION_NAME,
-            points=[point]
-        )
+        # Upsert to Qdrant (batched with concurrent stores)
+        await upsert_batcher.submit(point)
 
         return f"✅ Memory stored successfully with ID: {point_id}"
 
@@ -143,15 +413,25 @@ async def qdrant_list_collections() -> str:
         List of collection names and their point counts
     """
     try:
-        collections = qdrant_client.get_collections()
-        
+        collections = await metadata_cache.get_or_fetch(
+            ("collections",), qdrant_client.get_collections
+        )
+
         if not collections.collections:
             return "No collections found in Qdrant."
 
+        # Approximate counts are cheap and fetched concurrently
+        counts = await asyncio.gather(*(
+            metadata_cache.get_or_fetch(
+                ("count", collection.name),
+                lambda name=collection.name: qdrant_client.count(name, exact=False),
+            )
+            for collection in collections.collections
+        ))
+
         result = ["Collections in Qdrant:"]
-        for collection in collections.collections:
-            info = qdrant_client.get_collection(collection.name)
-            result.append(f"  - {collection.name}: {info.points_count} points")
+        for collection, count in zip(collections.collections, counts):
+            result.append(f"  - {collection.name}: {count.count} points")
 
         return "\n".join(result)
 
@@ -171,8 +451,10 @@ async def qdrant_collection_info(collection_name: str = None) -> str:
     """
     try:
         name = collection_name or COLLECTION_NAME
-        info = qdrant_client.get_collection(name)
-        
+        info = await metadata_cache.get_or_fetch(
+            ("collection", name), lambda: qdrant_client.get_collection(name)
+        )
+
         return f"""Collection: {name}
 Points: {info.points_count}
 Vectors: {info.vectors_count}
@@ -184,5 +466,37 @@ Distance: {info.config.params.vectors.distance if hasattr(info.config.params, 'v
         return f"Error getting collection info: {str(e)}"
 
 
+def ensure_collection():
+    """Create the memory collection with int8 scalar quantization.
+
+    Existing collections without quantization are updated in place.
+    Uses a sync client since this runs before the MCP event loop starts.
+    """
+    client = QdrantClient(url=QDRANT_URL)
+
+    if not client.collection_exists(COLLECTION_NAME):
+        client.create_collection(
+            collection_name=COLLECTION_NAME,
+            vectors_config=models.VectorParams(
+                size=EMBEDDING_DIMENSION,
+                distance=models.Distance.COSINE,
+                on_disk=True,
+            ),
+            quantization_config=QUANTIZATION_CONFIG,
+        )
+        return
+
+    info = client.get_collection(COLLECTION_NAME)
+    if info.config.quantization_config is None:
+        client.update_collection(
+            collection_name=COLLECTION_NAME,
+            quantization_config=QUANTIZATION_CONFIG,
+        )
+
+
 if __name__ == "__main__":
+    try:
+        ensure_collection()
+    except Exception as e:
+        print(f"Warning: could not configure collection quantization: {e}", file=sys.stderr)
     mcp.run()
@@ -9,6 +9,8 @@ LLM-powered interventions including nudging, restarting, and recreating agents.
 
 import asyncio
 import logging
+import logging.handlers
+import queue
 import signal
 import sys
 from pathlib import Path
@@ -29,14 +31,20 @@ from src.monitoring.monitor import MonitoringLoop
 from src.phases import PhaseManager
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("logs/monitor.log", mode="a")
-    ]
-)
+# Records are queued and written by a background listener thread so the
+# monitoring loop never blocks on stdout/disk writes.
+_log_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+_file_handler = logging.FileHandler("logs/monitor.log", mode="a")
+_file_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(_log_queue, _stream_handler, _file_handler)
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+log_listener.start()
 
 logger = logging.getLogger(__name__)
 
@@ -53,56 +61,79 @@ async def setup_monitoring_system():
         config = get_config()
         logger.info(f"Using monitoring interval: {config.monitoring_interval_seconds} seconds")
 
-        # Initialize database manager
-        db_manager = DatabaseManager()
-        logger.info("Database manager initialized")
-
-        # Initialize LLM provider
-        llm_provider = get_llm_provider()
-        logger.info(f"LLM provider initialized: {llm_provider.__class__.__name__}")
-
-        # Initialize agent manager
-        agent_manager = AgentManager(db_manager, llm_provider)
-        logger.info("Agent manager initialized")
-
-        # Initialize vector store manager
-        from src.memory.vector_store import VectorStoreManager
-        vector_store = VectorStoreManager(
-            qdrant_url=config.qdrant_url,
-            collection_prefix=config.qdrant_collection_prefix
+        # Initialize independent subsystems concurrently
+        async def init_db_manager():
+            db_manager = await asyncio.to_thread(DatabaseManager)
+            logger.info("Database manager initialized")
+            return db_manager
+
+        async def init_llm_provider():
+            llm_provider = await asyncio.to_thread(get_llm_provider)
+            logger.info(f"LLM provider initialized: {llm_provider.__class__.__name__}")
+            return llm_provider
+
+        async def init_vector_store():
+            from src.memory.vector_store import VectorStoreManager
+            vector_store = await asyncio.to_thread(
+                VectorStoreManager,
+                qdrant_url=config.qdrant_url,
+                collection_prefix=config.qdrant_collection_prefix
+            )
+            logger.info("Vector store manager initialized")
+            return vector_store
+
+        db_manager, llm_provider, vector_store = await asyncio.gather(
+            init_db_manager(), init_llm_provider(), init_vector_store()
         )
-        logger.info("Vector store manager initialized")
-
-        # Initialize RAG system
-        rag_system = RAGSystem(vector_store, llm_provider)
-        logger.info("RAG system initialized")
-
-        # Initialize phase manager (optional)
-        phase_manager = None
-        try:
-            phase_manager = PhaseManager(db_manager)
-            logger.info("Phase manager initialized")
-
-            # Load any active workflow from the database
-            logger.info("[DIAGNOSTIC] Checking for active workflows to resume...")
-            workflow_id = phase_manager.load_active_workflow()
-
-            if workflow_id:
-                logger.info(f"[DIAGNOSTIC] ✅ Loaded active workflow: {workflow_id[:8]}...")
-                logger.info(f"[DIAGNOSTIC] ✅ Diagnostic agent monitoring ENABLED for this workflow")
-            else:
-                logger.info(f"[DIAGNOSTIC] ℹ️  No active workflow found - diagnostic agent monitoring disabled")
 
-            # DEBUG: Verify the state
-            logger.info(f"[DIAGNOSTIC] PhaseManager.workflow_id = {phase_manager.workflow_id[:8] if phase_manager.workflow_id else 'None'}")
-            logger.info(f"[DIAGNOSTIC] PhaseManager.active_workflow exists = {phase_manager.active_workflow is not None}")
-
-        except Exception as e:
-            logger.warning(f"Phase manager initialization failed (optional): {e}")
-
-        # Initialize worktree manager for git merge operations
-        worktree_manager = WorktreeManager(db_manager=db_manager)
-        logger.info("Worktree manager initialized")
+        # Initialize components that depend on the subsystems above
+        async def init_agent_manager():
+            agent_manager = await asyncio.to_thread(AgentManager, db_manager, llm_provider)
+            logger.info("Agent manager initialized")
+            return agent_manager
+
+        async def init_rag_system():
+            rag_system = RAGSystem(vector_store, llm_provider)
+            logger.info("RAG system initialized")
+            return rag_system
+
+        async def init_phase_manager():
+            # Phase manager is optional
+            try:
+                phase_manager = await asyncio.to_thread(PhaseManager, db_manager)
+                logger.info("Phase manager initialized")
+
+                # Load any active workflow from the database
+                logger.info("[DIAGNOSTIC] Checking for active workflows to resume...")
+                workflow_id = await asyncio.to_thread(phase_manager.load_active_workflow)
+
+                if workflow_id:
+                    logger.info(f"[DIAGNOSTIC] ✅ Loaded active workflow: {workflow_id[:8]}...")
+                    logger.info(f"[DIAGNOSTIC] ✅ Diagnostic agent monitoring ENABLED for this workflow")
+                else:
+                    logger.info(f"[DIAGNOSTIC] ℹ️  No active workflow found - diagnostic agent monitoring disabled")
+
+                # DEBUG: Verify the state
+                logger.info(f"[DIAGNOSTIC] PhaseManager.workflow_id = {phase_manager.workflow_id[:8] if phase_manager.workflow_id else 'None'}")
+                logger.info(f"[DIAGNOSTIC] PhaseManager.active_workflow exists = {phase_manager.active_workflow is not None}")
+                return phase_manager
+
+            except Exception as e:
+                logger.warning(f"Phase manager initialization failed (optional): {e}")
+                return None
+
+        async def init_worktree_manager():
+            # Worktree manager handles git merge operations
+            worktree_manager = await asyncio.to_thread(WorktreeManager, db_manager=db_manager)
+            logger.info("Worktree manager initialized")
+            return worktree_manager
+
+        agent_manager, rag_system, phase_manager, worktree_manager = await asyncio.gather(
+            init_agent_manager(),
+            init_rag_system(),
+            init_phase_manager(),
+            init_worktree_manager(),
+        )
 
         # Create monitoring loop
         monitoring_loop = MonitoringLoop(
@@ -122,14 +153,15 @@ async def setup_monitoring_system():
         raise
 
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals gracefully."""
+def request_shutdown(signum: int, main_task: asyncio.Task):
+    """Handle shutdown signals gracefully (runs as an event loop callback)."""
     logger.info(f"Received signal {signum}, initiating graceful shutdown...")
 
     if monitoring_loop:
         asyncio.create_task(monitoring_loop.stop())
     else:
-        sys.exit(0)
+        # Still setting up - abort startup
+        main_task.cancel()
 
 
 async def main():
@@ -140,9 +172,11 @@ async def main():
     logger.info("Starting Hephaestus Monitoring Service")
     logger.info("=" * 60)
 
-    # Set up signal handlers for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Set up signal handlers for graceful shutdown on the running loop
+    loop = asyncio.get_running_loop()
+    main_task = asyncio.current_task()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, request_shutdown, sig, main_task)
 
     try:
         # Setup monitoring system
@@ -180,9 +214,12 @@ if __name__ == "__main__":
 
     try:
         asyncio.run(main())
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("Service interrupted by user")
         sys.exit(0)
     except Exception as e:
         logger.error(f"Service failed: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+    finally:
+        # Flush queued log records before exit
+        log_listener.stop()
\ No newline at end of file
@@ -6,38 +6,31 @@ from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+from src.core.migration_utils import apply_sqlite_additive_migration
 from src.core.simple_config import get_config
 
 
 def add_phase_cli_columns():
     """Add cli_tool, cli_model, and glm_api_token_env columns to phases table."""
     config = get_config()
-    engine = create_engine(f'sqlite:///{config.database_path}')
+    engine = create_engine(f'sqlite:///{config.database_path}', poolclass=NullPool)
 
     columns_to_add = [
-        ("cli_tool", "VARCHAR"),
-        ("cli_model", "VARCHAR"),
-        ("glm_api_token_env", "VARCHAR"),
+        ("cli_tool", "VARCHAR", None),
+        ("cli_model", "VARCHAR", None),
+        ("glm_api_token_env", "VARCHAR", None),
     ]
 
-    with engine.connect() as conn:
-        for column_name, column_type in columns_to_add:
-            try:
-                conn.execute(text(f"""
-                    ALTER TABLE phases
-                    ADD COLUMN {column_name} {column_type};
-                """))
-                print(f"✅ Added {column_name} column to phases table")
-            except Exception as e:
-                if "duplicate column name" in str(e).lower():
-                    print(f"⚠️  Column {column_name} already exists")
-                else:
-                    print(f"❌ Error adding {column_name}: {e}")
-                    raise
-
-        conn.commit()
-        print(f"\n✅ Migration completed successfully!")
+    added = apply_sqlite_additive_migration(engine, "phases", columns_to_add)
+    for column_name, _, _ in columns_to_add:
+        if column_name in added:
+            print(f"✅ Added {column_name} column to phases table")
+        else:
+            print(f"⚠️  Column {column_name} already exists")
+
+    print(f"\n✅ Migration completed successfully!")
 
 
 if __name__ == "__main__":
@@ -7,14 +7,20 @@ from pathlib import Path
 # Add parent directory to path (same pattern as init_db.py)
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+from src.core.migration_utils import apply_sqlite_additive_migration
 from src.core.simple_config import get_config
 
 
 def add_columns():
     """Add the new workflow branch and merge review columns."""
     config = get_config()
-    engine = create_engine(f'sqlite:///{config.database_path}')
+    # One-shot script: skip connection pool setup
+    engine = create_engine(
+        f'sqlite:///{config.database_path}',
+        poolclass=NullPool,
+    )
 
     # List of columns to add with their types and defaults
     columns_to_add = [
@@ -26,25 +32,13 @@ def add_columns():
         ("final_merge_commit_sha", "VARCHAR", None),
     ]
 
-    with engine.connect() as conn:
-        # Check which columns already exist
-        result = conn.execute(text("PRAGMA table_info(workflows)"))
-        existing_columns = {row[1] for row in result.fetchall()}
+    added = apply_sqlite_additive_migration(engine, "workflows", columns_to_add)
+    if not added:
+        print(f"✅ Schema up to date for {config.database_path}, nothing to migrate")
+        return
 
-        for col_name, col_type, default_val in columns_to_add:
-            if col_name in existing_columns:
-                print(f"  ⏭️  Column '{col_name}' already exists, skipping")
-                continue
-
-            if default_val is not None:
-                sql = f"ALTER TABLE workflows ADD COLUMN {col_name} {col_type} DEFAULT {default_val}"
-            else:
-                sql = f"ALTER TABLE workflows ADD COLUMN {col_name} {col_type}"
-
-            conn.execute(text(sql))
-            print(f"  ✅ Added column '{col_name}'")
-
-        conn.commit()
+    for col_name in added:
+        print(f"  ✅ Added column '{col_name}'")
 
     print(f"\n✅ Migration complete for {config.database_path}")
     print("   Added workflow branch isolation columns:")
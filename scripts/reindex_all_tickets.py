@@ -4,6 +4,10 @@ Script to reindex all existing tickets in Qdrant.
 
 This script regenerates embeddings for all tickets in the database
 and stores them in Qdrant with the correct point ID format (UUID without "ticket-" prefix).
+
+Run it after changing how ticket embeddings are built (such as the switch to
+weighted title/description/tag vectors), so stored vectors stay comparable
+with newly indexed tickets and search queries.
 """
 
 import asyncio
@@ -909,6 +909,10 @@ REMEMBER:
         """
         logger.info(f"Terminating agent {agent_id}")
 
+        # A terminated validator must not be reused for repeat validation requests
+        from src.validation.validator_agent import release_validator_agent_spawns
+        release_validator_agent_spawns(agent_id)
+
         session = self.db_manager.get_session()
         try:
             agent = session.query(Agent).filter_by(id=agent_id).first()
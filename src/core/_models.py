@@ -0,0 +1,56 @@
+"""Data models for multi-provider LLM configuration.
+
+These are plain containers filled from the already-parsed YAML config, so
+they are slotted dataclasses rather than validating pydantic models.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, List, Union
+
+
+@dataclass(slots=True, kw_only=True)
+class ModelInfo:
+    """Model information for OpenRouter."""
+    provider: Optional[str] = None
+    model: str
+
+
+@dataclass(slots=True, kw_only=True)
+class ProviderConfig:
+    """Provider configuration."""
+    api_key_env: str
+    base_url: Optional[str] = None
+    models: List[Union[str, Dict[str, str]]] = field(default_factory=list)
+    # Azure-specific fields
+    api_version: Optional[str] = None  # For Azure OpenAI (e.g., "2024-02-01")
+    # Google Vertex AI-specific fields (for future use)
+    project_id: Optional[str] = None
+    location: Optional[str] = None  # e.g., "us-central1"
+
+
+@dataclass(slots=True, kw_only=True)
+class ModelAssignment:
+    """Model assignment for a component."""
+    provider: str
+    model: str
+    openrouter_provider: Optional[str] = None
+    temperature: float = 0.7
+    max_tokens: int = 4000
+
+    def __post_init__(self):
+        # YAML may hand back ints for temperature or strings for either field
+        self.temperature = float(self.temperature)
+        self.max_tokens = int(self.max_tokens)
+
+
+@dataclass(slots=True, kw_only=True)
+class MultiProviderLLMConfig:
+    """Multi-provider LLM configuration."""
+    # Embedding model to use
+    embedding_model: str = "text-embedding-3-small"
+    # Provider for embeddings (openai, azure_openai, google_ai)
+    embedding_provider: str = "openai"
+    # Provider configurations
+    providers: Dict[str, ProviderConfig] = field(default_factory=dict)
+    # Model assignments per component
+    model_assignments: Dict[str, ModelAssignment] = field(default_factory=dict)
@@ -1015,6 +1015,16 @@ class DatabaseManager:
                     )
                 )
 
+                # Memories are looked up per agent, oldest first
+                conn.execute(
+                    text(
+                        """
+                    CREATE INDEX IF NOT EXISTS idx_memories_agent_created
+                    ON memories(agent_id, created_at)
+                """
+                    )
+                )
+
                 conn.commit()
                 logger.info("Created performance indexes for ticket tracking system")
         except Exception as e:
@@ -1,59 +1,33 @@
 """LLM configuration management for multi-provider support."""
 
-from typing import Dict, Any, Optional, List, Union
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from pathlib import Path
+import functools
+import json
+import mmap
 import yaml
 import os
 
-from pydantic import BaseModel, Field, field_validator
-from pydantic_settings import BaseSettings
-
-
-class ModelInfo(BaseModel):
-    """Model information for OpenRouter."""
-    provider: Optional[str] = None
-    model: str
-
-
-class ProviderConfig(BaseModel):
-    """Provider configuration."""
-    api_key_env: str
-    base_url: Optional[str] = None
-    models: List[Union[str, Dict[str, str]]]
-    # Azure-specific fields
-    api_version: Optional[str] = None  # For Azure OpenAI (e.g., "2024-02-01")
-    # Google Vertex AI-specific fields (for future use)
-    project_id: Optional[str] = None
-    location: Optional[str] = None  # e.g., "us-central1"
-
-
-class ModelAssignment(BaseModel):
-    """Model assignment for a component."""
-    provider: str
-    model: str
-    openrouter_provider: Optional[str] = None
-    temperature: float = 0.7
-    max_tokens: int = 4000
-
-
-class MultiProviderLLMConfig(BaseModel):
-    """Multi-provider LLM configuration."""
-    embedding_model: str = Field(
-        default="text-embedding-3-small",
-        description="Embedding model to use"
-    )
-    embedding_provider: str = Field(
-        default="openai",
-        description="Provider for embeddings (openai, azure_openai, google_ai)"
-    )
-    providers: Dict[str, ProviderConfig] = Field(
-        default_factory=dict,
-        description="Provider configurations"
-    )
-    model_assignments: Dict[str, ModelAssignment] = Field(
-        default_factory=dict,
-        description="Model assignments per component"
-    )
+# Prefer libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+if TYPE_CHECKING:
+    from src.core._models import MultiProviderLLMConfig
+
+# Config models live in _models and are imported on first use (PEP 562)
+_LAZY_MODELS = ("ModelInfo", "ProviderConfig", "ModelAssignment", "MultiProviderLLMConfig")
+
+_MISSING = object()
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODELS:
+        from src.core import _models
+        return getattr(_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SimpleConfig:
@@ -67,7 +41,9 @@ class SimpleConfig:
         """
         self.config_path = Path(config_path)
         self._config: Dict[str, Any] = {}
-        self._llm_config: Optional[MultiProviderLLMConfig] = None
+        self._llm_config: Optional["MultiProviderLLMConfig"] = None
+        self._env_cache: Dict[str, Optional[str]] = {}
+        self._flat: Dict[str, Any] = {}
         self.load_config()
 
     def load_config(self):
@@ -75,11 +51,15 @@ class SimpleConfig:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
-        with open(self.config_path, 'r') as f:
-            self._config = yaml.safe_load(f)
+        # Re-read environment variables on every (re)load
+        self._env_cache.clear()
+        self._config = self._read_config_file()
+        self._flat = self._flatten(self._config)
 
         # Parse LLM configuration
         if 'llm' in self._config:
+            from src.core._models import ProviderConfig, ModelAssignment, MultiProviderLLMConfig
+
             llm_data = self._config['llm']
 
             # Convert to proper format
@@ -97,7 +77,7 @@ class SimpleConfig:
                     # Allow environment variable to override base_url for openrouter
                     base_url = provider_data.get('base_url')
                     if provider_name == 'openrouter':
-                        env_base_url = os.getenv('OPENROUTER_BASE_URL')
+                        env_base_url = self._env('OPENROUTER_BASE_URL')
                         if env_base_url:
                             base_url = env_base_url
 
@@ -123,7 +103,74 @@ class SimpleConfig:
                 model_assignments=model_assignments
             )
 
-    def get_llm_config(self) -> MultiProviderLLMConfig:
+    def _read_config_file(self) -> Dict[str, Any]:
+        """Parse the YAML config, reusing a JSON sidecar cache when enabled.
+
+        With HEPHAESTUS_CONFIG_CACHE=1 the parsed config is stored next to the
+        YAML file and reused while the file's mtime and size are unchanged.
+        """
+        if os.getenv("HEPHAESTUS_CONFIG_CACHE") != "1":
+            return self._parse_yaml()
+
+        stat = self.config_path.stat()
+        cache_path = self.config_path.with_name(self.config_path.name + ".jsoncache")
+
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            if cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+                return cached["config"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        config = self._parse_yaml()
+
+        # Write atomically so concurrent readers never see a partial cache
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "config": config}, f)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            # Not writable or not JSON-serializable (e.g. YAML dates) - skip caching
+            tmp_path.unlink(missing_ok=True)
+
+        return config
+
+    def _parse_yaml(self) -> Any:
+        """Parse the YAML file straight from a read-only memory map."""
+        with open(self.config_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap cannot map empty files
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return yaml.load(mm, Loader=_YamlLoader)
+
+    @staticmethod
+    def _flatten(config: Any) -> Dict[str, Any]:
+        """Map every dotted key path in the config to its value."""
+        flat: Dict[str, Any] = {}
+
+        def walk(node: Dict[str, Any], prefix: str):
+            for k, v in node.items():
+                key = f"{prefix}.{k}" if prefix else str(k)
+                flat[key] = v
+                if isinstance(v, dict):
+                    walk(v, key)
+
+        if isinstance(config, dict):
+            walk(config, "")
+        return flat
+
+    def _env(self, name: str) -> Optional[str]:
+        """Look up an environment variable, memoized until the next load_config()."""
+        value = self._env_cache.get(name, _MISSING)
+        if value is _MISSING:
+            value = os.environ.get(name)
+            self._env_cache[name] = value
+        return value
+
+    def get_llm_config(self) -> "MultiProviderLLMConfig":
         """Get LLM configuration.
 
         Returns:
@@ -131,6 +178,7 @@ class SimpleConfig:
         """
         if not self._llm_config:
             # Return default if not configured
+            from src.core._models import MultiProviderLLMConfig
             return MultiProviderLLMConfig()
         return self._llm_config
 
@@ -144,18 +192,8 @@ class SimpleConfig:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-
-        return value
+        value = self._flat.get(key)
+        return default if value is None else value
 
     @property
     def llm_provider(self) -> str:
@@ -195,11 +233,14 @@ class SimpleConfig:
         # Check for required API keys based on configured providers
         if self._llm_config:
             missing_keys = []
+            # Check each provider's key once, however many components use it
+            has_key: Dict[str, bool] = {}
             for component, assignment in self._llm_config.model_assignments.items():
                 provider_config = self._llm_config.providers.get(assignment.provider)
                 if provider_config:
-                    api_key = os.getenv(provider_config.api_key_env)
-                    if not api_key:
+                    if assignment.provider not in has_key:
+                        has_key[assignment.provider] = bool(self._env(provider_config.api_key_env))
+                    if not has_key[assignment.provider]:
                         missing_keys.append(
                             f"{assignment.provider} for {component} "
                             f"(env var: {provider_config.api_key_env})"
@@ -230,25 +271,26 @@ class SimpleConfig:
 
         if self._llm_config and provider in self._llm_config.providers:
             provider_config = self._llm_config.providers[provider]
-            return os.getenv(provider_config.api_key_env)
+            return self._env(provider_config.api_key_env)
 
         # Fallback to legacy env vars
         if provider == 'openai':
-            return os.getenv('OPENAI_API_KEY')
+            return self._env('OPENAI_API_KEY')
         elif provider == 'anthropic':
-            return os.getenv('ANTHROPIC_API_KEY')
+            return self._env('ANTHROPIC_API_KEY')
         elif provider == 'groq':
-            return os.getenv('GROQ_API_KEY')
+            return self._env('GROQ_API_KEY')
         elif provider == 'openrouter':
-            return os.getenv('OPENROUTER_API_KEY')
+            return self._env('OPENROUTER_API_KEY')
         elif provider == 'azure_openai':
-            return os.getenv('AZURE_OPENAI_API_KEY')
+            return self._env('AZURE_OPENAI_API_KEY')
         elif provider == 'google_ai':
-            return os.getenv('GOOGLE_API_KEY')
+            return self._env('GOOGLE_API_KEY')
         elif provider == 'vertex_ai':
             # Vertex AI uses service account auth (GOOGLE_APPLICATION_CREDENTIALS)
             # Return a placeholder to indicate auth is handled differently
-            return os.getenv('GOOGLE_APPLICATION_CREDENTIALS', 'service_account')
+            credentials = self._env('GOOGLE_APPLICATION_CREDENTIALS')
+            return credentials if credentials is not None else 'service_account'
 
         return None
 
@@ -289,23 +331,26 @@ class SimpleConfig:
         return self.get('agents.default_cli_tool', 'claude')
 
 
-# Global configuration instance
-_config = None
+@functools.lru_cache(maxsize=None)
+def _load_config(abs_path: str) -> SimpleConfig:
+    """Create the shared configuration instance for an absolute path.
+
+    Unbounded: evicting a path would give later callers a second instance
+    that no longer matches the one earlier callers still hold.
+    """
+    return SimpleConfig(abs_path)
 
 
 def get_config(config_path: str = "./hephaestus_config.yaml") -> SimpleConfig:
-    """Get or create global configuration instance.
+    """Get or create the configuration instance for a config file.
 
     Args:
         config_path: Path to configuration file
 
     Returns:
-        Configuration instance
+        Configuration instance (shared by all callers using the same file)
     """
-    global _config
-    if _config is None:
-        _config = SimpleConfig(config_path)
-    return _config
+    return _load_config(str(Path(config_path).resolve()))
 
 
 def reload_config(config_path: str = "./hephaestus_config.yaml") -> SimpleConfig:
@@ -317,6 +362,5 @@ def reload_config(config_path: str = "./hephaestus_config.yaml") -> SimpleConfig
     Returns:
         New configuration instance
     """
-    global _config
-    _config = SimpleConfig(config_path)
-    return _config
\ No newline at end of file
+    _load_config.cache_clear()
+    return get_config(config_path)
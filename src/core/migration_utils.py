@@ -0,0 +1,52 @@
+"""Helpers for simple additive SQLite schema migrations."""
+
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy.engine import Engine
+
+# (column name, SQL type, SQL default literal or None)
+ColumnSpec = Tuple[str, str, Optional[str]]
+
+
+@lru_cache(maxsize=None)
+def _build_add_column_sql(table: str, column: ColumnSpec) -> str:
+    """Build the ALTER TABLE statement for a single column."""
+    col_name, col_type, default_val = column
+    sql = f"ALTER TABLE {table} ADD COLUMN {col_name} {col_type}"
+    if default_val is not None:
+        sql += f" DEFAULT {default_val}"
+    return sql
+
+
+def apply_sqlite_additive_migration(
+    engine: Engine,
+    table: str,
+    columns: Sequence[ColumnSpec],
+) -> List[str]:
+    """Add any missing columns to a SQLite table in a single transaction.
+
+    Args:
+        engine: SQLAlchemy engine bound to the SQLite database
+        table: Table to alter
+        columns: (name, type, default) tuples; default is a SQL literal or None
+
+    Returns:
+        Names of the columns that were added (empty if the schema was current)
+    """
+    with engine.connect() as conn:
+        result = conn.exec_driver_sql(f"PRAGMA table_info({table})")
+        existing_columns = frozenset(row[1] for row in result.fetchall())
+
+    missing = [tuple(column) for column in columns if column[0] not in existing_columns]
+    if not missing:
+        return []
+
+    # engine.begin() commits once on exit. pysqlite runs DDL in autocommit
+    # mode, so open the transaction explicitly to apply all ALTERs together.
+    with engine.begin() as conn:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        for column in missing:
+            conn.exec_driver_sql(_build_add_column_sql(table, column))
+
+    return [column[0] for column in missing]
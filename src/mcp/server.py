@@ -1775,18 +1775,17 @@ async def update_task_status(
             task.validation_iteration += 1
             task.completion_notes = request.summary
 
+            # Mark original agent as kept alive for validation, in the same commit
+            agent = session.query(Agent).filter_by(id=agent_id).first()
+            if agent:
+                agent.kept_alive_for_validation = True
+
             # Capture task attributes before async function (to avoid detached instance issues)
             task_validation_iteration = task.validation_iteration
             task_workflow_id = task.workflow_id
 
             session.commit()
 
-            # Mark original agent as kept alive for validation (do this immediately)
-            agent = session.query(Agent).filter_by(id=agent_id).first()
-            if agent:
-                agent.kept_alive_for_validation = True
-                session.commit()
-
             # Process validation spawning asynchronously (like create_task)
             async def spawn_validation_async():
                 try:
@@ -2228,6 +2227,10 @@ async def give_validation_review(
 
             session.commit()
 
+            # The review is in, so a later validation needs a fresh validator
+            from src.validation.validator_agent import release_validator_spawns
+            release_validator_spawns("task", request.task_id)
+
             # Merge agent's work to parent (if using worktrees)
             if hasattr(server_state, 'worktree_manager') and original_agent_id:
                 try:
@@ -2273,6 +2276,10 @@ async def give_validation_review(
             task.last_validation_feedback = request.feedback
             session.commit()
 
+            # The review is in, so the next claim gets a fresh validator
+            from src.validation.validator_agent import release_validator_spawns
+            release_validator_spawns("task", request.task_id)
+
             # Send feedback to the still-running agent
             from src.validation.validator_agent import send_feedback_to_agent
             feedback_sent = send_feedback_to_agent(
@@ -2494,6 +2501,10 @@ async def submit_result_validation(
             validator_agent_id=agent_id
         )
 
+        # The review is in, so a resubmission gets a fresh validator
+        from src.validation.validator_agent import release_validator_spawns
+        release_validator_spawns("result", request.result_id)
+
         # Handle workflow actions
         workflow_action_taken = None
         if "terminate_workflow" in outcome["next_actions"]:
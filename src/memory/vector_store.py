@@ -1,21 +1,54 @@
 """Vector store management for RAG system using Qdrant."""
 
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Optional, Tuple, Union
 from datetime import datetime
+import asyncio
+import heapq
 import logging
-from qdrant_client import QdrantClient
-from qdrant_client.models import (
-    Distance,
-    VectorParams,
-    PointStruct,
-    Filter,
-    FieldCondition,
-    MatchValue,
-)
-from qdrant_client.http.exceptions import UnexpectedResponse
+import os
+import threading
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Embeddings may be passed as lists or numpy arrays; qdrant-client accepts both
+Vector = Union[List[float], "np.ndarray"]
+
+# gRPC is opt-in: the documented `docker run -p 6333:6333` only exposes REST
+PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC") == "1"
+GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+
+# One client (and connection pool) per Qdrant URL, shared by all managers
+_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(qdrant_url: str):
+    """Get the shared QdrantClient for a URL, creating it on first use."""
+    with _clients_lock:
+        client = _clients.get(qdrant_url)
+        if client is None:
+            # qdrant_client builds its full model tree on import; defer it until used
+            from qdrant_client import QdrantClient
+
+            client = QdrantClient(url=qdrant_url, prefer_grpc=PREFER_GRPC, grpc_port=GRPC_PORT)
+            _clients[qdrant_url] = client
+        return client
+
+
+def _project_result(result) -> Dict[str, Any]:
+    """Convert a Qdrant scored point into a search result dict."""
+    metadata = dict(result.payload)
+    content = metadata.pop("content", "")
+    return {
+        "id": str(result.id),
+        "score": result.score,
+        "content": content,
+        "metadata": metadata,
+    }
+
 
 class VectorStoreManager:
     """Manages vector storage and retrieval using Qdrant."""
@@ -37,6 +70,7 @@ class VectorStoreManager:
         "error_solutions": {
             "size": 3072,
             "description": "Known error patterns and fixes",
+            "quantization": "binary",  # Small and latency-critical
         },
         "domain_knowledge": {
             "size": 3072,
@@ -52,6 +86,9 @@ class VectorStoreManager:
         },
     }
 
+    # Default quantization for collections without a "quantization" key
+    DEFAULT_QUANTIZATION = "int8"
+
     def __init__(self, qdrant_url: str = "http://localhost:6333", collection_prefix: str = "hephaestus"):
         """Initialize Qdrant client and collections.
 
@@ -59,55 +96,80 @@ class VectorStoreManager:
             qdrant_url: URL of the Qdrant server
             collection_prefix: Prefix for collection names
         """
-        self.client = QdrantClient(url=qdrant_url)
+        self.client = _get_client(qdrant_url)
         self.collection_prefix = collection_prefix
+        self._full_names = {
+            collection: f"{collection_prefix}_{collection}" for collection in self.COLLECTIONS
+        }
         self._initialize_collections()
 
     def _get_collection_name(self, collection: str) -> str:
-        """Get the full collection name with prefix."""
-        return f"{self.collection_prefix}_{collection}"
+        """Get the full collection name with prefix.
+
+        Raises:
+            ValueError: If the collection is not one of COLLECTIONS
+        """
+        try:
+            return self._full_names[collection]
+        except KeyError:
+            raise ValueError(f"Unknown collection: {collection}") from None
 
     def _initialize_collections(self):
         """Initialize all required collections in Qdrant."""
+        from qdrant_client.models import (
+            BinaryQuantization,
+            BinaryQuantizationConfig,
+            Distance,
+            ScalarQuantization,
+            ScalarQuantizationConfig,
+            ScalarType,
+            VectorParams,
+        )
+
+        # Quantized vectors stay in RAM; Qdrant rescores the top hits with
+        # the original float32 vectors
+        quantization_configs = {
+            "int8": ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+            ),
+            "binary": BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True)),
+            None: None,
+        }
+
+        # List existing collections once rather than once per collection
+        try:
+            existing = {c.name for c in self.client.get_collections().collections}
+        except Exception:
+            # If listing fails, try to create every collection anyway
+            existing = set()
+
         for collection_name, config in self.COLLECTIONS.items():
             full_name = self._get_collection_name(collection_name)
+            if full_name in existing:
+                logger.info(f"Collection '{full_name}' already exists")
+                continue
+
             try:
-                # Check if collection exists by listing all collections
-                collections = self.client.get_collections()
-                exists = any(c.name == full_name for c in collections.collections)
-
-                if exists:
-                    logger.info(f"Collection '{full_name}' already exists")
-                else:
-                    # Create collection if it doesn't exist
-                    self.client.create_collection(
-                        collection_name=full_name,
-                        vectors_config=VectorParams(
-                            size=config["size"],
-                            distance=Distance.COSINE,
-                        ),
-                    )
-                    logger.info(f"Created collection '{full_name}': {config['description']}")
-            except Exception as e:
-                # If listing fails, try to create anyway
-                try:
-                    self.client.create_collection(
-                        collection_name=full_name,
-                        vectors_config=VectorParams(
-                            size=config["size"],
-                            distance=Distance.COSINE,
-                        ),
-                    )
-                    logger.info(f"Created collection '{full_name}': {config['description']}")
-                except:
-                    # Collection likely already exists
-                    logger.debug(f"Collection '{full_name}' initialization handled")
+                self.client.create_collection(
+                    collection_name=full_name,
+                    vectors_config=VectorParams(
+                        size=config["size"],
+                        distance=Distance.COSINE,
+                    ),
+                    quantization_config=quantization_configs[
+                        config.get("quantization", self.DEFAULT_QUANTIZATION)
+                    ],
+                )
+                logger.info(f"Created collection '{full_name}': {config['description']}")
+            except:
+                # Collection likely already exists
+                logger.debug(f"Collection '{full_name}' initialization handled")
 
     async def store_memory(
         self,
         collection: str,
         memory_id: str,
-        embedding: List[float],
+        embedding: Vector,
         content: str,
         metadata: Dict[str, Any],
     ) -> bool:
@@ -118,43 +180,67 @@ class VectorStoreManager:
             memory_id: Unique identifier for the memory
             embedding: Vector embedding of the content
             content: The actual content
-            metadata: Additional metadata
+            metadata: Additional metadata (used as the payload; do not reuse)
 
         Returns:
             Success status
         """
-        if collection not in self.COLLECTIONS:
-            raise ValueError(f"Unknown collection: {collection}")
+        return await self.store_memories(
+            collection, [(memory_id, embedding, content, metadata)]
+        )
 
-        full_name = self._get_collection_name(collection)
+    async def store_memories(
+        self,
+        collection: str,
+        items: Iterable[Tuple[str, Vector, str, Dict[str, Any]]],
+        wait: bool = True,
+    ) -> bool:
+        """Store several memories in the specified collection with one upsert.
 
-        # Prepare the point (Qdrant accepts UUIDs as strings directly)
-        point = PointStruct(
-            id=memory_id,  # Can be a UUID string
-            vector=embedding,
-            payload={
-                "content": content,
-                "memory_id": memory_id,  # Store the original ID in payload
-                "timestamp": datetime.utcnow().isoformat(),
-                **metadata,
-            },
-        )
+        Args:
+            collection: Collection name (without prefix)
+            items: (memory_id, embedding, content, metadata) tuples; each
+                metadata dict is reused as the point payload, so callers must
+                not reuse it afterwards
+            wait: Wait for Qdrant to apply the upsert before returning
+
+        Returns:
+            Success status
+        """
+        from qdrant_client.models import PointStruct
+
+        full_name = self._get_collection_name(collection)
+        timestamp = datetime.utcnow().isoformat()
+
+        # Prepare the points (Qdrant accepts UUIDs as strings directly).
+        # Each metadata dict becomes the payload in place; metadata keys keep
+        # precedence over the base fields as before.
+        points = []
+        for memory_id, embedding, content, metadata in items:
+            payload = metadata if type(metadata) is dict else dict(metadata)
+            payload.setdefault("content", content)
+            payload.setdefault("memory_id", memory_id)  # Store the original ID in payload
+            payload.setdefault("timestamp", timestamp)
+            points.append(PointStruct(id=memory_id, vector=embedding, payload=payload))
+        if not points:
+            return True
 
         try:
             self.client.upsert(
                 collection_name=full_name,
-                points=[point],
+                points=points,
+                wait=wait,
             )
-            logger.debug(f"Stored memory {memory_id} in collection {full_name}")
+            logger.debug(f"Stored {len(points)} memories in collection {full_name}")
             return True
         except Exception as e:
-            logger.error(f"Failed to store memory {memory_id}: {e}")
+            logger.error(f"Failed to store {len(points)} memories in {full_name}: {e}")
             return False
 
     async def search(
         self,
         collection: str,
-        query_vector: List[float],
+        query_vector: Vector,
         limit: int = 10,
         filters: Optional[Dict[str, Any]] = None,
         score_threshold: Optional[float] = None,
@@ -171,14 +257,13 @@ class VectorStoreManager:
         Returns:
             List of search results with content and metadata
         """
-        if collection not in self.COLLECTIONS:
-            raise ValueError(f"Unknown collection: {collection}")
-
         full_name = self._get_collection_name(collection)
 
         # Build filter if provided
         qdrant_filter = None
         if filters:
+            from qdrant_client.models import Filter, FieldCondition, MatchValue
+
             conditions = []
             for key, value in filters.items():
                 conditions.append(
@@ -192,7 +277,10 @@ class VectorStoreManager:
 
         try:
             # Use query_points (new API) instead of deprecated search method
-            response = self.client.query_points(
+            # Run the blocking client call off the event loop so concurrent
+            # searches (see search_all_collections) overlap their round trips
+            response = await asyncio.to_thread(
+                self.client.query_points,
                 collection_name=full_name,
                 query=query_vector,
                 limit=limit,
@@ -204,24 +292,14 @@ class VectorStoreManager:
             # query_points returns an object with .points attribute
             results = response.points if hasattr(response, 'points') else response
 
-            return [
-                {
-                    "id": str(result.id),
-                    "score": result.score,
-                    "content": result.payload.get("content", ""),
-                    "metadata": {
-                        k: v for k, v in result.payload.items() if k != "content"
-                    },
-                }
-                for result in results
-            ]
+            return [_project_result(result) for result in results]
         except Exception as e:
             logger.error(f"Search failed in collection {full_name}: {e}")
             return []
 
     async def search_all_collections(
         self,
-        query_vector: List[float],
+        query_vector: Vector,
         limit_per_collection: int = 5,
         total_limit: int = 20,
     ) -> List[Dict[str, Any]]:
@@ -235,23 +313,34 @@ class VectorStoreManager:
         Returns:
             Aggregated and ranked results from all collections
         """
-        all_results = []
-
-        for collection_name in self.COLLECTIONS.keys():
+        async def search_collection(collection_name: str):
             results = await self.search(
                 collection=collection_name,
                 query_vector=query_vector,
                 limit=limit_per_collection,
             )
-
-            # Add collection source to metadata
+            return collection_name, results
+
+        # Fold results into a bounded min-heap as each collection responds.
+        # search() logs and returns [] on failure, so one bad collection
+        # cannot fail the whole fan-in.
+        heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        seq = 0
+        for next_done in asyncio.as_completed(
+            [search_collection(collection_name) for collection_name in self.COLLECTIONS]
+        ):
+            collection_name, results = await next_done
             for result in results:
+                # Add collection source to metadata
                 result["collection"] = collection_name
-                all_results.append(result)
+                entry = (result["score"], seq, result)
+                seq += 1
+                if len(heap) < total_limit:
+                    heapq.heappush(heap, entry)
+                elif heap and entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
 
-        # Sort by score and limit total results
-        all_results.sort(key=lambda x: x["score"], reverse=True)
-        return all_results[:total_limit]
+        return [result for _, _, result in sorted(heap, reverse=True)]
 
     def delete_memory(self, collection: str, memory_id: str) -> bool:
         """Delete a memory from a collection.
@@ -263,9 +352,6 @@ class VectorStoreManager:
         Returns:
             Success status
         """
-        if collection not in self.COLLECTIONS:
-            raise ValueError(f"Unknown collection: {collection}")
-
         full_name = self._get_collection_name(collection)
 
         try:
@@ -288,9 +374,6 @@ class VectorStoreManager:
         Returns:
             Collection statistics
         """
-        if collection not in self.COLLECTIONS:
-            raise ValueError(f"Unknown collection: {collection}")
-
         full_name = self._get_collection_name(collection)
 
         try:
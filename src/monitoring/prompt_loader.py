@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import json
 import structlog
 
@@ -17,6 +17,8 @@ class PromptLoader:
         self.prompts_dir = Path(__file__).parent.parent / "prompts"
         if not self.prompts_dir.exists():
             raise ValueError(f"Prompts directory not found: {self.prompts_dir}")
+        # prompt name -> (file mtime_ns, template text)
+        self._prompt_cache: Dict[str, Tuple[int, str]] = {}
 
     def load_prompt(self, prompt_name: str) -> str:
         """Load a prompt from its markdown file.
@@ -24,15 +26,25 @@ class PromptLoader:
         Args:
             prompt_name: Name of the prompt file (without .md extension)
 
+        Templates are cached and only re-read when the file's mtime changes.
+
         Returns:
             Raw prompt template string
         """
         prompt_path = self.prompts_dir / f"{prompt_name}.md"
-        if not prompt_path.exists():
+        try:
+            mtime_ns = os.stat(prompt_path).st_mtime_ns
+        except FileNotFoundError:
             raise ValueError(f"Prompt file not found: {prompt_path}")
 
+        cached = self._prompt_cache.get(prompt_name)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         with open(prompt_path, "r") as f:
-            return f.read()
+            template = f.read()
+        self._prompt_cache[prompt_name] = (mtime_ns, template)
+        return template
 
     def format_guardian_prompt(
         self,
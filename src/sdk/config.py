@@ -5,7 +5,112 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 
 
-@dataclass
+def _or_empty(value: Optional[str]) -> str:
+    return value or ""
+
+
+def _str_lower(value: Any) -> str:
+    return str(value).lower()
+
+# (attribute, env var, default) filled from the environment when not provided
+_ENV_DEFAULTS = (
+    ("openai_api_key", "OPENAI_API_KEY", None),
+    ("anthropic_api_key", "ANTHROPIC_API_KEY", None),
+    ("openrouter_api_key", "OPENROUTER_API_KEY", None),
+    ("groq_api_key", "GROQ_API_KEY", None),
+    # Vertex AI settings
+    ("vertex_ai_project", "GOOGLE_CLOUD_PROJECT", None),
+    ("vertex_ai_location", "GOOGLE_CLOUD_LOCATION", "global"),
+)
+
+# provider -> (attribute, env var, display name) that must be set for it
+_PROVIDER_REQUIRED_SETTING = {
+    "openai": ("openai_api_key", "OPENAI_API_KEY", "OpenAI"),
+    "anthropic": ("anthropic_api_key", "ANTHROPIC_API_KEY", "Anthropic"),
+    "openrouter": ("openrouter_api_key", "OPENROUTER_API_KEY", "OpenRouter"),
+    "groq": ("groq_api_key", "GROQ_API_KEY", "Groq"),
+    # Vertex AI uses service account auth, just needs project_id
+    "vertex_ai": ("vertex_ai_project", "GOOGLE_CLOUD_PROJECT", "Vertex AI"),
+}
+
+# Dict keys keep the documented order for the error message
+_VALID_PROVIDERS = _PROVIDER_REQUIRED_SETTING.keys()
+
+# (attribute, env var, converter) for settings always passed to the backend
+_ENV_SPEC = (
+    # Database
+    ("database_path", "DATABASE_PATH", str),
+
+    # Qdrant / Vector Store
+    ("qdrant_url", "QDRANT_URL", str),
+    ("collection_prefix", "VECTOR_STORE_COLLECTION_PREFIX", str),
+    ("embedding_dimension", "EMBEDDING_DIMENSION", str),
+    ("embedding_model", "EMBEDDING_MODEL", str),
+
+    # LLM
+    ("llm_provider", "LLM_PROVIDER", str),
+    ("llm_model", "LLM_MODEL", _or_empty),
+
+    # Server
+    ("mcp_port", "MCP_PORT", str),
+    ("mcp_host", "MCP_HOST", str),
+    ("enable_cors", "SERVER_ENABLE_CORS", _str_lower),
+
+    # Monitoring
+    ("monitoring_interval", "MONITORING_INTERVAL_SECONDS", str),
+    ("monitoring_enabled", "MONITORING_ENABLED", _str_lower),
+    ("log_level", "LOG_LEVEL", str),
+    ("log_format", "LOG_FORMAT", str),
+    ("stuck_agent_threshold", "STUCK_AGENT_THRESHOLD", str),
+
+    # Paths
+    ("working_directory", "WORKING_DIRECTORY", str),
+    ("worktree_base", "WORKTREE_BASE", str),
+
+    # Git Configuration
+    ("base_branch", "GIT_BASE_BRANCH", str),
+    ("worktree_branch_prefix", "WORKTREE_BRANCH_PREFIX", str),
+    ("auto_commit", "AUTO_COMMIT", _str_lower),
+    ("conflict_resolution", "CONFLICT_RESOLUTION", str),
+    ("require_final_review", "REQUIRE_FINAL_REVIEW", _str_lower),
+    ("workflow_branch_prefix", "WORKFLOW_BRANCH_PREFIX", str),
+
+    # Agent Configuration
+    ("default_cli_tool", "DEFAULT_CLI_TOOL", str),
+    ("tmux_session_prefix", "TMUX_SESSION_PREFIX", str),
+    ("health_check_interval", "HEALTH_CHECK_INTERVAL", str),
+    ("max_health_failures", "MAX_HEALTH_FAILURES", str),
+    ("termination_delay", "TERMINATION_DELAY", str),
+
+    # MCP Server Configuration
+    ("auth_required", "AUTH_REQUIRED", _str_lower),
+    ("session_timeout", "SESSION_TIMEOUT", str),
+    ("max_concurrent_agents", "MAX_CONCURRENT_AGENTS", str),
+
+    # Task Deduplication
+    ("task_deduplication_enabled", "TASK_DEDUPLICATION_ENABLED", _str_lower),
+    ("similarity_threshold", "SIMILARITY_THRESHOLD", str),
+    ("related_threshold", "RELATED_THRESHOLD", str),
+    ("dedup_batch_size", "DEDUP_BATCH_SIZE", str),
+
+    # Diagnostic Agent Configuration
+    ("diagnostic_agent_enabled", "DIAGNOSTIC_AGENT_ENABLED", _str_lower),
+    ("diagnostic_cooldown_seconds", "DIAGNOSTIC_COOLDOWN_SECONDS", str),
+    ("diagnostic_min_stuck_time_seconds", "DIAGNOSTIC_MIN_STUCK_TIME", str),
+)
+
+# (attribute, env var) for settings passed only when set
+_OPTIONAL_ENV_SPEC = (
+    ("openai_api_key", "OPENAI_API_KEY"),
+    ("anthropic_api_key", "ANTHROPIC_API_KEY"),
+    ("openrouter_api_key", "OPENROUTER_API_KEY"),
+    ("groq_api_key", "GROQ_API_KEY"),
+    ("vertex_ai_project", "GOOGLE_CLOUD_PROJECT"),
+    ("vertex_ai_location", "GOOGLE_CLOUD_LOCATION"),
+)
+
+
+@dataclass(slots=True)
 class HephaestusConfig:
     """Configuration for the Hephaestus SDK.
 
@@ -97,24 +202,10 @@ class HephaestusConfig:
 
     def __post_init__(self):
         """Load API keys from environment if not provided."""
-        if not self.openai_api_key:
-            self.openai_api_key = os.getenv("OPENAI_API_KEY")
-
-        if not self.anthropic_api_key:
-            self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
-
-        if not self.openrouter_api_key:
-            self.openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
-
-        if not self.groq_api_key:
-            self.groq_api_key = os.getenv("GROQ_API_KEY")
-        
-        # Vertex AI settings from environment
-        if not self.vertex_ai_project:
-            self.vertex_ai_project = os.getenv("GOOGLE_CLOUD_PROJECT")
-        
-        if not self.vertex_ai_location:
-            self.vertex_ai_location = os.getenv("GOOGLE_CLOUD_LOCATION", "global")
+        env = os.environ
+        for attr, key, default in _ENV_DEFAULTS:
+            if not getattr(self, attr):
+                setattr(self, attr, env.get(key, default))
 
         # Set default model based on provider
         if not self.llm_model:
@@ -131,83 +222,13 @@ class HephaestusConfig:
         This passes ALL configuration settings to the backend via environment variables,
         matching the structure of hephaestus_config.yaml.
         """
-        env = {
-            # Database
-            "DATABASE_PATH": self.database_path,
-
-            # Qdrant / Vector Store
-            "QDRANT_URL": self.qdrant_url,
-            "VECTOR_STORE_COLLECTION_PREFIX": self.collection_prefix,
-            "EMBEDDING_DIMENSION": str(self.embedding_dimension),
-            "EMBEDDING_MODEL": self.embedding_model,
-
-            # LLM
-            "LLM_PROVIDER": self.llm_provider,
-            "LLM_MODEL": self.llm_model or "",
-
-            # Server
-            "MCP_PORT": str(self.mcp_port),
-            "MCP_HOST": self.mcp_host,
-            "SERVER_ENABLE_CORS": str(self.enable_cors).lower(),
-
-            # Monitoring
-            "MONITORING_INTERVAL_SECONDS": str(self.monitoring_interval),
-            "MONITORING_ENABLED": str(self.monitoring_enabled).lower(),
-            "LOG_LEVEL": self.log_level,
-            "LOG_FORMAT": self.log_format,
-            "STUCK_AGENT_THRESHOLD": str(self.stuck_agent_threshold),
-
-            # Paths
-            "WORKING_DIRECTORY": self.working_directory,
-            "WORKTREE_BASE": self.worktree_base,
-
-            # Git Configuration
-            "GIT_BASE_BRANCH": self.base_branch,
-            "WORKTREE_BRANCH_PREFIX": self.worktree_branch_prefix,
-            "AUTO_COMMIT": str(self.auto_commit).lower(),
-            "CONFLICT_RESOLUTION": self.conflict_resolution,
-            "REQUIRE_FINAL_REVIEW": str(self.require_final_review).lower(),
-            "WORKFLOW_BRANCH_PREFIX": self.workflow_branch_prefix,
-
-            # Agent Configuration
-            "DEFAULT_CLI_TOOL": self.default_cli_tool,
-            "TMUX_SESSION_PREFIX": self.tmux_session_prefix,
-            "HEALTH_CHECK_INTERVAL": str(self.health_check_interval),
-            "MAX_HEALTH_FAILURES": str(self.max_health_failures),
-            "TERMINATION_DELAY": str(self.termination_delay),
-
-            # MCP Server Configuration
-            "AUTH_REQUIRED": str(self.auth_required).lower(),
-            "SESSION_TIMEOUT": str(self.session_timeout),
-            "MAX_CONCURRENT_AGENTS": str(self.max_concurrent_agents),
-
-            # Task Deduplication
-            "TASK_DEDUPLICATION_ENABLED": str(self.task_deduplication_enabled).lower(),
-            "SIMILARITY_THRESHOLD": str(self.similarity_threshold),
-            "RELATED_THRESHOLD": str(self.related_threshold),
-            "DEDUP_BATCH_SIZE": str(self.dedup_batch_size),
-
-            # Diagnostic Agent Configuration
-            "DIAGNOSTIC_AGENT_ENABLED": str(self.diagnostic_agent_enabled).lower(),
-            "DIAGNOSTIC_COOLDOWN_SECONDS": str(self.diagnostic_cooldown_seconds),
-            "DIAGNOSTIC_MIN_STUCK_TIME": str(self.diagnostic_min_stuck_time_seconds),
-        }
-
-        # API Keys (only if set)
-        if self.openai_api_key:
-            env["OPENAI_API_KEY"] = self.openai_api_key
-        if self.anthropic_api_key:
-            env["ANTHROPIC_API_KEY"] = self.anthropic_api_key
-        if self.openrouter_api_key:
-            env["OPENROUTER_API_KEY"] = self.openrouter_api_key
-        if self.groq_api_key:
-            env["GROQ_API_KEY"] = self.groq_api_key
-        
-        # Vertex AI settings (only if set)
-        if self.vertex_ai_project:
-            env["GOOGLE_CLOUD_PROJECT"] = self.vertex_ai_project
-        if self.vertex_ai_location:
-            env["GOOGLE_CLOUD_LOCATION"] = self.vertex_ai_location
+        env = {key: convert(getattr(self, attr)) for attr, key, convert in _ENV_SPEC}
+
+        # API keys and Vertex AI settings (only if set)
+        for attr, key in _OPTIONAL_ENV_SPEC:
+            value = getattr(self, attr)
+            if value:
+                env[key] = value
 
         # Optional Paths
         if self.phases_temp_dir:
@@ -230,28 +251,17 @@ class HephaestusConfig:
 
     def validate(self) -> None:
         """Validate configuration."""
-        # Check API keys for simple providers
-        if self.llm_provider == "openai" and not self.openai_api_key:
-            raise ValueError("OPENAI_API_KEY must be set for OpenAI provider")
-
-        if self.llm_provider == "anthropic" and not self.anthropic_api_key:
-            raise ValueError("ANTHROPIC_API_KEY must be set for Anthropic provider")
-
-        if self.llm_provider == "openrouter" and not self.openrouter_api_key:
-            raise ValueError("OPENROUTER_API_KEY must be set for OpenRouter provider")
-
-        if self.llm_provider == "groq" and not self.groq_api_key:
-            raise ValueError("GROQ_API_KEY must be set for Groq provider")
-        
-        # Vertex AI uses service account auth, just needs project_id
-        if self.llm_provider == "vertex_ai" and not self.vertex_ai_project:
-            raise ValueError("GOOGLE_CLOUD_PROJECT must be set for Vertex AI provider")
+        # Check the API key (or project, for Vertex AI's service account auth)
+        required = _PROVIDER_REQUIRED_SETTING.get(self.llm_provider)
+        if required is not None:
+            attr, env_var, display_name = required
+            if not getattr(self, attr):
+                raise ValueError(f"{env_var} must be set for {display_name} provider")
 
         # Check provider is valid
-        valid_providers = ["openai", "anthropic", "openrouter", "groq", "vertex_ai"]
-        if self.llm_provider not in valid_providers:
+        if self.llm_provider not in _VALID_PROVIDERS:
             raise ValueError(
-                f"Invalid LLM provider: {self.llm_provider}. Must be one of {valid_providers}"
+                f"Invalid LLM provider: {self.llm_provider}. Must be one of {list(_VALID_PROVIDERS)}"
             )
 
         # Check port is valid
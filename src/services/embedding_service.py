@@ -1,15 +1,42 @@
 """Service for generating and comparing embeddings for task deduplication."""
 
+import asyncio
+import hashlib
+import math
 import numpy as np
 import openai
 from typing import List, Dict, Any, Optional
 import logging
 import os
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from collections import OrderedDict
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 from src.core.simple_config import get_config
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_CACHE_SIZE = 1024  # Number of recent embeddings kept in memory
+
+# Below this dimension plain Python arithmetic beats numpy's array setup cost
+_SCALAR_SIMILARITY_MAX_DIM = 64
+
+# Status codes worth retrying: timeouts, conflicts and rate limits
+_RETRYABLE_STATUS_CODES = frozenset((408, 409, 429))
+
+
+def _is_retryable_embedding_error(exc: BaseException) -> bool:
+    """Decide whether an embedding request failure is worth retrying.
+
+    OpenAI errors are retried only when transient (connection problems,
+    rate limits, 5xx); client errors such as BadRequestError fail at once.
+    The LangChain providers raise their own SDK errors, so anything else is
+    retried unless it is a local programming error.
+    """
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code in _RETRYABLE_STATUS_CODES or exc.status_code >= 500
+    if isinstance(exc, openai.OpenAIError):
+        return isinstance(exc, openai.APIConnectionError)
+    return not isinstance(exc, (ValueError, TypeError, AttributeError, KeyError))
+
 
 class EmbeddingService:
     """Service for generating and comparing embeddings.
@@ -44,8 +71,18 @@ class EmbeddingService:
         
         self._embedding_model = None
         self._openai_client = None
-        
-        self._initialize_provider(openai_api_key)
+        self._embedding_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+
+        # Provider clients (and their LangChain imports) are created on the
+        # first embedding request, so similarity-only callers never pay for them
+        self._openai_api_key = openai_api_key
+        self._provider_ready = False
+
+    def _ensure_provider(self):
+        """Initialize the embedding provider on first use."""
+        if not self._provider_ready:
+            self._initialize_provider(self._openai_api_key)
+            self._provider_ready = True
 
     def _initialize_provider(self, openai_api_key: Optional[str] = None):
         """Initialize the appropriate embedding provider."""
@@ -115,12 +152,24 @@ class EmbeddingService:
             if api_key:
                 self._openai_client = openai.OpenAI(api_key=api_key)
 
+        # Longest input sent to the provider (LangChain models take less)
+        self._max_chars = 8000 if self._embedding_model is not None else 30000
+
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Key the embedding cache on a digest of the (truncated) text."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _cache_embedding(self, cache_key: bytes, embedding: List[float]):
+        """Remember an embedding, evicting the least recently used one when full."""
+        self._embedding_cache[cache_key] = embedding
+        if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(min=1, max=10),
-        retry=retry_if_exception_type(
-            (openai.APIError, openai.APIConnectionError, openai.RateLimitError, Exception)
-        ),
+        retry=retry_if_exception(_is_retryable_embedding_error),
         reraise=True,
     )
     async def generate_embedding(self, text: str) -> List[float]:
@@ -137,26 +186,39 @@ class EmbeddingService:
         Raises:
             Exception: If embedding generation fails after retries
         """
+        self._ensure_provider()
+
         # Truncate text if too long
-        max_chars = 30000
+        max_chars = self._max_chars
         if len(text) > max_chars:
             logger.warning(f"Text truncated from {len(text)} to {max_chars} characters")
             text = text[:max_chars]
 
+        # Identical texts (e.g. unchanged tickets being reindexed) reuse the
+        # embedding from the last call instead of hitting the API again
+        cache_key = self._cache_key(text)
+        cached = self._embedding_cache.get(cache_key)
+        if cached is not None:
+            self._embedding_cache.move_to_end(cache_key)
+            return cached
+
         try:
             if self._embedding_model is not None:
                 # Use LangChain embedding model (Vertex AI or Google AI)
-                embedding = await self._embedding_model.aembed_query(text[:8000])
+                embedding = await self._embedding_model.aembed_query(text)
                 logger.debug(f"Generated embedding with dimension: {len(embedding)} via {self.embedding_provider}")
+                self._cache_embedding(cache_key, embedding)
                 return embedding
                 
             elif self._openai_client is not None:
                 # Use OpenAI client directly
+                # The SDK requests base64 and decodes it when no format is given
                 response = self._openai_client.embeddings.create(
-                    model=self.model, input=text, encoding_format="float"
+                    model=self.model, input=text
                 )
                 embedding = response.data[0].embedding
                 logger.debug(f"Generated embedding with dimension: {len(embedding)} via OpenAI")
+                self._cache_embedding(cache_key, embedding)
                 return embedding
             else:
                 logger.error("No embedding provider initialized")
@@ -171,6 +233,95 @@ class EmbeddingService:
             logger.error(f"Failed to generate embedding via {self.embedding_provider}: {e}")
             raise
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(min=1, max=10),
+        retry=retry_if_exception(_is_retryable_embedding_error),
+        reraise=True,
+    )
+    async def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for several texts with a single API request.
+
+        Embeddings match what generate_embedding returns for each text, so
+        batch and single results can be compared directly. Both share the
+        same cache; only texts without a cached embedding are sent.
+
+        Args:
+            texts: Texts to generate embeddings for
+
+        Returns:
+            One embedding vector per input text, in input order
+
+        Raises:
+            Exception: If embedding generation fails after retries
+        """
+        if not texts:
+            return []
+
+        self._ensure_provider()
+
+        # Same truncation as generate_embedding
+        max_chars = self._max_chars
+        texts = [text[:max_chars] if len(text) > max_chars else text for text in texts]
+
+        if self._embedding_model is None and self._openai_client is None:
+            logger.error("No embedding provider initialized")
+            # Return zero vectors as fallback
+            dimension = getattr(self.config, 'task_embedding_dimension', 3072)
+            return [[0.0] * dimension for _ in texts]
+
+        cache_keys = [self._cache_key(text) for text in texts]
+        results: List[Optional[List[float]]] = [self._embedding_cache.get(key) for key in cache_keys]
+        missing = []
+        for i, result in enumerate(results):
+            if result is None:
+                missing.append(i)
+            else:
+                self._embedding_cache.move_to_end(cache_keys[i])
+        if not missing:
+            return results
+
+        embeddings = await self._embed_texts([texts[i] for i in missing])
+        for i, embedding in zip(missing, embeddings):
+            results[i] = embedding
+            self._cache_embedding(cache_keys[i], embedding)
+        return results
+
+    async def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Send one embedding request for texts and return vectors in input order."""
+        try:
+            if self._embedding_model is not None:
+                # Embed as queries, like aembed_query in generate_embedding
+                if self.embedding_provider == "vertex_ai":
+                    embeddings = await asyncio.to_thread(
+                        self._embedding_model.embed_documents,
+                        texts,
+                        embeddings_task_type="RETRIEVAL_QUERY",
+                    )
+                else:
+                    embeddings = await self._embedding_model.aembed_documents(
+                        texts, task_type="RETRIEVAL_QUERY"
+                    )
+                logger.debug(f"Generated {len(embeddings)} embeddings via {self.embedding_provider}")
+                return embeddings
+            else:
+                response = self._openai_client.embeddings.create(
+                    model=self.model, input=texts
+                )
+                embeddings = [
+                    item.embedding
+                    for item in sorted(response.data, key=lambda item: item.index)
+                ]
+                logger.debug(f"Generated {len(embeddings)} embeddings via OpenAI")
+                return embeddings
+
+        except (openai.APIError, openai.APIConnectionError, openai.RateLimitError) as e:
+            logger.warning(f"OpenAI API error (will retry): {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to generate {len(texts)} embeddings via {self.embedding_provider}: {e}")
+            raise
+
     def calculate_cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors.
 
@@ -191,21 +342,24 @@ class EmbeddingService:
             return 0.0
 
         try:
-            # Convert to numpy arrays for efficient computation
-            arr1 = np.array(vec1, dtype=np.float32)
-            arr2 = np.array(vec2, dtype=np.float32)
-
-            # Calculate norms
-            norm_a = np.linalg.norm(arr1)
-            norm_b = np.linalg.norm(arr2)
+            if len(vec1) < _SCALAR_SIMILARITY_MAX_DIM:
+                dot = sum(a * b for a, b in zip(vec1, vec2))
+                norm_sq = sum(a * a for a in vec1) * sum(b * b for b in vec2)
+            else:
+                # Stack both vectors so a single matrix product yields the dot
+                # product and both squared norms in one pass over the data
+                pair = np.array((vec1, vec2), dtype=np.float32)
+                gram = pair @ pair.T
+                dot = float(gram[0, 1])
+                norm_sq = float(gram[0, 0]) * float(gram[1, 1])
 
             # Handle zero vectors
-            if norm_a == 0 or norm_b == 0:
+            if norm_sq == 0:
                 logger.warning("Zero vector provided for similarity calculation")
                 return 0.0
 
             # Calculate cosine similarity
-            similarity = np.dot(arr1, arr2) / (norm_a * norm_b)
+            similarity = float(dot) / math.sqrt(norm_sq)
 
             # Ensure result is in valid range (floating point errors can cause slight overflow)
             similarity = np.clip(similarity, -1.0, 1.0)
@@ -234,22 +388,20 @@ class EmbeddingService:
         try:
             # Convert to numpy arrays
             query_arr = np.array(query_embedding, dtype=np.float32)
-            embeddings_arr = np.array(embeddings, dtype=np.float32)
 
             # Normalize query
-            query_norm = np.linalg.norm(query_arr)
+            query_norm = math.sqrt(np.einsum('i,i->', query_arr, query_arr))
             if query_norm == 0:
                 return [0.0] * len(embeddings)
             query_normalized = query_arr / query_norm
 
-            # Normalize embeddings
-            norms = np.linalg.norm(embeddings_arr, axis=1)
+            # Divide the N dot products by the row norms instead of
+            # writing out a normalized copy of the whole matrix first
+            matrix = np.array(embeddings, dtype=np.float32, ndmin=2)
+            norms = np.sqrt(np.einsum('ij,ij->i', matrix, matrix))
             # Avoid division by zero
             norms[norms == 0] = 1.0
-            embeddings_normalized = embeddings_arr / norms[:, np.newaxis]
-
-            # Calculate dot products (cosine similarities)
-            similarities = np.dot(embeddings_normalized, query_normalized)
+            similarities = (matrix @ query_normalized) / norms
 
             # Clip to valid range and convert to list
             similarities = np.clip(similarities, -1.0, 1.0)
@@ -266,10 +418,14 @@ class EmbeddingService:
         """
         Generate weighted embedding for ticket content.
 
-        Weighting strategy:
-        - Title: 2x weight (repeat title twice in input)
+        Title, description and tags are embedded separately in one batched
+        request and combined as a weighted average of the three vectors:
+        - Title: 2x weight
         - Description: 1x weight
-        - Tags: 1.5x weight (repeat tags approximately 1.5x)
+        - Tags: 1.5x weight
+
+        Each part is cached on its own, so editing the description does not
+        re-embed an unchanged title or tag list.
 
         Args:
             title: Ticket title
@@ -277,15 +433,27 @@ class EmbeddingService:
             tags: List of tags
 
         Returns:
-            Embedding vector (dimension depends on configured model)
+            Unit-length embedding vector (dimension depends on configured model),
+            or a zero vector if every part is empty
         """
-        # Combine with weights
-        # Title gets 2x weight, tags get ~1.5x weight
-        tag_text = " ".join(tags)
-        weighted_text = f"{title} {title} {description} {tag_text} {tag_text}"
+        parts = [(title, 2.0), (description, 1.0), (" ".join(tags), 1.5)]
+        # Providers reject empty inputs, and an empty part carries no signal
+        parts = [(text, weight) for text, weight in parts if text.strip()]
+        if not parts:
+            logger.warning("Ticket has no title, description or tags to embed")
+            # Zero vector, like the no-provider fallback
+            dimension = getattr(self.config, 'task_embedding_dimension', 3072)
+            return [0.0] * dimension
 
         logger.debug(f"Generating weighted ticket embedding (title 2x, tags 1.5x)")
-        return await self.generate_embedding(weighted_text)
+        embeddings = await self.generate_embeddings_batch([text for text, _ in parts])
+
+        weights = np.array([weight for _, weight in parts], dtype=np.float32)
+        combined = weights @ np.asarray(embeddings, dtype=np.float32)
+        norm = np.linalg.norm(combined)
+        if norm > 0:
+            combined /= norm
+        return combined.tolist()
 
     async def generate_query_embedding(self, query: str) -> List[float]:
         """
@@ -3,13 +3,44 @@
 import os
 import re
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Iterable, Iterator, List, Dict, Any, Tuple
+
+from sqlalchemy import and_, exists, func, or_, select
 
 from src.core.database import get_db, Memory, Agent, Task
 
 logger = logging.getLogger(__name__)
 
+# Threads used to write incident report files
+_REPORT_WRITE_WORKERS = 8
+
+# Incident rows fetched from the database per round trip
+_QUERY_BATCH_SIZE = 500
+
+# Holds the next free incident number, so later exports skip the directory scan
+_NEXT_ID_FILENAME = ".next_id"
+
+# Slug cleanup patterns, compiled once rather than looked up per incident
+_SLUG_DROP = re.compile(r'[^a-z0-9\s-]')
+# Whitespace, underscores and dashes all collapse to a single dash
+_SLUG_COLLAPSE = re.compile(r'[\s_-]+')
+# The ASCII characters _SLUG_DROP removes, for bytes.translate on ASCII titles
+_SLUG_DROP_ASCII = bytes(c for c in range(128) if _SLUG_DROP.match(chr(c)))
+
+# One "key: value" field of structured incident content, at the start of a
+# "|"-separated part
+_INCIDENT_FIELD = re.compile(r'(?:^|\|)\s*(INCIDENT|symptom|attempted|status|verify):([^|]*)')
+_INCIDENT_FIELD_NAMES = {
+    "INCIDENT": "title",
+    "symptom": "symptom",
+    "attempted": "attempted",
+    "status": "status",
+    "verify": "verify",
+}
+
 
 class IncidentExportService:
     """Exports incident memories to markdown format at workflow end."""
@@ -30,9 +61,15 @@ class IncidentExportService:
 
         incidents = IncidentExportService._query_incidents(workflow_id)
 
+        # Reports are written as incidents stream in from the database; only
+        # the few fields the timeline and index need are kept per incident
+        incident_files, incidents, by_status, by_classification = (
+            IncidentExportService._export_incident_reports(incidents, output_dir)
+        )
         timeline_path = IncidentExportService._export_timeline(incidents, output_dir)
-        incident_files = IncidentExportService._export_incident_reports(incidents, output_dir)
-        readme_path = IncidentExportService._export_index(incidents, incident_files, output_dir)
+        readme_path = IncidentExportService._export_index(
+            incident_files, by_status, by_classification, output_dir
+        )
 
         return {
             "total_incidents": len(incidents),
@@ -42,42 +79,77 @@ class IncidentExportService:
         }
 
     @staticmethod
-    def _query_incidents(workflow_id: str) -> List[Dict[str, Any]]:
-        """Query all memories with 'incident' tag for this workflow."""
-        with get_db() as session:
-            # Find agents through tasks since Agent doesn't have workflow_id directly
-            agent_ids = session.query(Task.assigned_agent_id).filter(
-                Task.workflow_id == workflow_id,
-                Task.assigned_agent_id.isnot(None)
-            ).distinct().all()
-            agent_ids = [a[0] for a in agent_ids if a[0]]
-
-            if not agent_ids:
-                return []
-
-            memories = session.query(Memory).filter(
-                Memory.agent_id.in_(agent_ids)
-            ).order_by(Memory.created_at).all()
-
-            incidents = []
-            for mem in memories:
-                tags = mem.tags or []
-                if "incident" in tags:
-                    incidents.append({
-                        "id": mem.id,
-                        "agent_id": mem.agent_id,
-                        "content": mem.content,
-                        "memory_type": mem.memory_type,
-                        "tags": tags,
-                        "related_files": mem.related_files or [],
-                        "created_at": mem.created_at,
-                    })
-
-            return incidents
+    def _query_incidents(workflow_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield all memories with 'incident' tag for this workflow, oldest first.
+
+        Rows are fetched in batches, each in its own short session, so large
+        workflows are never loaded into memory at once and no session stays
+        open while the caller writes report files.
+        """
+        # Find agents through tasks since Agent doesn't have workflow_id directly
+        agent_ids = select(Task.assigned_agent_id).where(
+            Task.workflow_id == workflow_id,
+            Task.assigned_agent_id.isnot(None)
+        ).distinct().scalar_subquery()
+
+        # Match the tag inside the JSON array in SQL so only incident rows
+        # (and only the columns we export) are loaded
+        tag = func.json_each(Memory.tags).table_valued("value")
+        has_incident_tag = exists(select(1).select_from(tag).where(tag.c.value == "incident"))
+
+        last_seen = None
+        while True:
+            with get_db() as session:
+                query = session.query(
+                    Memory.id,
+                    Memory.agent_id,
+                    Memory.content,
+                    Memory.memory_type,
+                    Memory.tags,
+                    Memory.related_files,
+                    Memory.created_at,
+                ).filter(
+                    Memory.agent_id.in_(agent_ids),
+                    has_incident_tag,
+                )
+                if last_seen is not None:
+                    # Resume after the last row of the previous batch; created_at
+                    # is NOT NULL, so the keyset needs no IS NULL branch
+                    last_created_at, last_id = last_seen
+                    query = query.filter(or_(
+                        Memory.created_at > last_created_at,
+                        and_(Memory.created_at == last_created_at, Memory.id > last_id),
+                    ))
+                rows = query.order_by(Memory.created_at, Memory.id).limit(_QUERY_BATCH_SIZE).all()
+
+            for mem_id, agent_id, content, memory_type, tags, related_files, created_at in rows:
+                yield {
+                    "id": mem_id,
+                    "agent_id": agent_id,
+                    "content": content,
+                    "memory_type": memory_type,
+                    "tags": tags,
+                    "related_files": related_files or [],
+                    "created_at": created_at,
+                }
+
+            if len(rows) < _QUERY_BATCH_SIZE:
+                return
+            last_seen = (rows[-1].created_at, rows[-1].id)
 
     @staticmethod
     def _parse_incident_content(content: str) -> Dict[str, str]:
         """Parse structured incident content into components."""
+        if not content.startswith("INCIDENT:"):
+            # Free-form memory: the content is the symptom
+            return {
+                "title": content[:50] + "..." if len(content) > 50 else content,
+                "symptom": content,
+                "attempted": "",
+                "status": "OPEN",
+                "verify": "",
+            }
+
         result = {
             "title": "Unknown Incident",
             "symptom": "",
@@ -85,24 +157,8 @@ class IncidentExportService:
             "status": "OPEN",
             "verify": "",
         }
-
-        if content.startswith("INCIDENT:"):
-            parts = content.split("|")
-            for part in parts:
-                part = part.strip()
-                if part.startswith("INCIDENT:"):
-                    result["title"] = part.replace("INCIDENT:", "").strip()
-                elif part.startswith("symptom:"):
-                    result["symptom"] = part.replace("symptom:", "").strip()
-                elif part.startswith("attempted:"):
-                    result["attempted"] = part.replace("attempted:", "").strip()
-                elif part.startswith("status:"):
-                    result["status"] = part.replace("status:", "").strip()
-                elif part.startswith("verify:"):
-                    result["verify"] = part.replace("verify:", "").strip()
-        else:
-            result["title"] = content[:50] + "..." if len(content) > 50 else content
-            result["symptom"] = content
+        for match in _INCIDENT_FIELD.finditer(content):
+            result[_INCIDENT_FIELD_NAMES[match.group(1)]] = match.group(2).strip()
 
         return result
 
@@ -110,28 +166,37 @@ class IncidentExportService:
     def _generate_slug(title: str) -> str:
         """Generate kebab-case slug from title."""
         slug = title.lower()
-        slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-        slug = re.sub(r'[\s_]+', '-', slug)
-        slug = re.sub(r'-+', '-', slug)
-        slug = slug.strip('-')
-        return slug[:40]
+        if slug.isascii():
+            slug = slug.encode('ascii').translate(None, _SLUG_DROP_ASCII).decode('ascii')
+        else:
+            slug = _SLUG_DROP.sub('', slug)
+        return _SLUG_COLLAPSE.sub('-', slug).strip('-')[:40]
 
     @staticmethod
     def _get_next_incident_id(output_dir: str) -> int:
-        """Scan existing INC-*.md files and return next ID."""
+        """Return the next ID from .next_id, or scan existing INC-*.md files."""
         incidents_dir = os.path.join(output_dir, "incidents")
         if not os.path.exists(incidents_dir):
             return 1
 
+        try:
+            with open(os.path.join(incidents_dir, _NEXT_ID_FILENAME), encoding="utf-8") as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            # Missing or unreadable (e.g. reports from before .next_id existed)
+            pass
+
         max_id = 0
-        for filename in os.listdir(incidents_dir):
-            if filename.startswith("INC-") and filename.endswith(".md"):
-                try:
-                    id_str = filename.split("-")[1]
-                    id_num = int(id_str)
-                    max_id = max(max_id, id_num)
-                except (IndexError, ValueError):
-                    continue
+        # scandir yields names without a stat() per entry
+        with os.scandir(incidents_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if filename.startswith("INC-") and filename.endswith(".md"):
+                    try:
+                        id_num = int(filename.split("-")[1])
+                        max_id = max(max_id, id_num)
+                    except (IndexError, ValueError):
+                        continue
 
         return max_id + 1
 
@@ -140,42 +205,67 @@ class IncidentExportService:
         """Generate timeline.md with one line per incident."""
         timeline_path = os.path.join(output_dir, "timeline.md")
 
-        with open(timeline_path, "w") as f:
-            f.write("# Incident Timeline\n\n")
-            f.write("| Timestamp | Title | Status | Agent | Tags |\n")
-            f.write("|-----------|-------|--------|-------|------|\n")
+        # Build the whole file and write it in one call
+        lines = [
+            "# Incident Timeline\n\n",
+            "| Timestamp | Title | Status | Agent | Tags |\n",
+            "|-----------|-------|--------|-------|------|\n",
+        ]
 
-            for inc in incidents:
-                parsed = IncidentExportService._parse_incident_content(inc["content"])
-                timestamp = inc["created_at"].strftime("%Y-%m-%d %H:%M UTC")
-                agent_short = inc["agent_id"][:8]
-                tags = ", ".join(t for t in inc["tags"] if t != "incident")
+        for inc in incidents:
+            agent_short = inc["agent_id"][:8]
+            tags = ", ".join(inc["classifications"])
+
+            lines.append(f"| {inc['timestamp']} | {inc['title'][:40]} | {inc['status']} | {agent_short} | {tags} |\n")
 
-                f.write(f"| {timestamp} | {parsed['title'][:40]} | {parsed['status']} | {agent_short} | {tags} |\n")
+        IncidentExportService._write_file(timeline_path, "".join(lines))
 
         return timeline_path
 
     @staticmethod
-    def _export_incident_reports(incidents: List[Dict], output_dir: str) -> List[str]:
-        """Generate INC-NNNN-slug.md for each incident."""
+    def _export_incident_reports(
+        incidents: Iterable[Dict], output_dir: str
+    ) -> Tuple[List[str], List[Dict[str, Any]], Counter, Counter]:
+        """Generate INC-NNNN-slug.md for each incident.
+
+        Returns:
+            The report filenames; per incident a summary with the fields the
+            timeline uses (timestamp, title, status, agent_id, classifications); and
+            incident counts by status and by classification for the index
+        """
         incident_files = []
+        summaries = []
+        by_status: Counter = Counter()
+        by_classification: Counter = Counter()
         next_id = IncidentExportService._get_next_incident_id(output_dir)
+        incidents_dir = os.path.join(output_dir, "incidents")
 
-        for i, inc in enumerate(incidents):
-            parsed = IncidentExportService._parse_incident_content(inc["content"])
-            slug = IncidentExportService._generate_slug(parsed["title"])
-            inc_id = f"INC-{next_id + i:04d}"
-            filename = f"{inc_id}-{slug}.md"
-            filepath = os.path.join(output_dir, "incidents", filename)
-
-            classifications = [t for t in inc["tags"] if t != "incident"]
-            classification = classifications[0] if classifications else "unknown"
-
-            with open(filepath, "w") as f:
-                f.write(f"""---
+        # Report files are independent, so overlap their writes
+        with ThreadPoolExecutor(max_workers=_REPORT_WRITE_WORKERS) as executor:
+            futures = []
+            for i, inc in enumerate(incidents):
+                parsed = IncidentExportService._parse_incident_content(inc["content"])
+                slug = IncidentExportService._generate_slug(parsed["title"])
+                inc_id = f"INC-{next_id + i:04d}"
+                filename = f"{inc_id}-{slug}.md"
+                filepath = os.path.join(incidents_dir, filename)
+
+                created_at = inc["created_at"]
+                classifications = [t for t in inc["tags"] if t != "incident"]
+                classification = classifications[0] if classifications else "unknown"
+                by_status[parsed["status"]] += 1
+                by_classification.update(classifications)
+
+                # Built outside the f-string, which can't contain "\n" before Python 3.12
+                if inc["related_files"]:
+                    related_files = "\n".join("- " + f for f in inc["related_files"])
+                else:
+                    related_files = "None recorded"
+
+                futures.append(executor.submit(IncidentExportService._write_file, filepath, f"""---
 id: {inc_id}
 status: {parsed['status']}
-timestamp_opened: {inc['created_at'].isoformat()}
+timestamp_opened: {created_at.isoformat()}
 severity: MEDIUM
 classification: {classification}
 tags: {inc['tags']}
@@ -200,52 +290,79 @@ agent_id: {inc['agent_id']}
 
 # Related Files
 
-{chr(10).join('- ' + f for f in inc['related_files']) if inc['related_files'] else 'None recorded'}
+{related_files}
 
 # Raw Memory Content
 
 ```
 {inc['content']}
 ```
-""")
-            incident_files.append(filename)
+"""))
+                incident_files.append(filename)
+                summaries.append({
+                    "timestamp": created_at.strftime("%Y-%m-%d %H:%M UTC"),
+                    "title": parsed["title"],
+                    "status": parsed["status"],
+                    "agent_id": inc["agent_id"],
+                    "classifications": classifications,
+                })
+
+            # Surface any write error
+            for future in futures:
+                future.result()
+
+        if incident_files:
+            IncidentExportService._write_file(
+                os.path.join(incidents_dir, _NEXT_ID_FILENAME),
+                str(next_id + len(incident_files)),
+            )
+
+        return incident_files, summaries, by_status, by_classification
 
-        return incident_files
+    @staticmethod
+    def _write_file(path: str, content: str) -> None:
+        """Write one export file with a single unbuffered write."""
+        data = content.encode("utf-8")
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            # os.write may write less than asked on some platforms
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
     @staticmethod
-    def _export_index(incidents: List[Dict], incident_files: List[str], output_dir: str) -> str:
+    def _export_index(
+        incident_files: List[str],
+        by_status: Counter,
+        by_classification: Counter,
+        output_dir: str,
+    ) -> str:
         """Generate README.md with index and statistics."""
         readme_path = os.path.join(output_dir, "README.md")
 
-        by_status: Dict[str, int] = {}
-        by_classification: Dict[str, int] = {}
-        for inc in incidents:
-            parsed = IncidentExportService._parse_incident_content(inc["content"])
-            status = parsed["status"]
-            by_status[status] = by_status.get(status, 0) + 1
-
-            classifications = [t for t in inc["tags"] if t != "incident"]
-            for c in classifications:
-                by_classification[c] = by_classification.get(c, 0) + 1
-
-        with open(readme_path, "w") as f:
-            f.write("# Agent Incidents\n\n")
-            f.write(f"**Total Incidents**: {len(incidents)}\n\n")
+        # Build the whole file and write it in one call
+        lines = [
+            "# Agent Incidents\n\n",
+            f"**Total Incidents**: {len(incident_files)}\n\n",
+            "## Statistics\n\n",
+            "### By Status\n",
+        ]
+        for status, count in sorted(by_status.items()):
+            lines.append(f"- {status}: {count}\n")
 
-            f.write("## Statistics\n\n")
-            f.write("### By Status\n")
-            for status, count in sorted(by_status.items()):
-                f.write(f"- {status}: {count}\n")
+        lines.append("\n### By Classification\n")
+        for classification, count in sorted(by_classification.items()):
+            lines.append(f"- {classification}: {count}\n")
 
-            f.write("\n### By Classification\n")
-            for classification, count in sorted(by_classification.items()):
-                f.write(f"- {classification}: {count}\n")
+        lines.append("\n## Incident Index\n\n")
+        for filename in incident_files:
+            lines.append(f"- [incidents/{filename}](incidents/{filename})\n")
 
-            f.write("\n## Incident Index\n\n")
-            for filename in incident_files:
-                f.write(f"- [incidents/{filename}](incidents/{filename})\n")
+        lines.append("\n## Timeline\n\n")
+        lines.append("See [timeline.md](timeline.md) for chronological view.\n")
 
-            f.write("\n## Timeline\n\n")
-            f.write("See [timeline.md](timeline.md) for chronological view.\n")
+        IncidentExportService._write_file(readme_path, "".join(lines))
 
         return readme_path
@@ -334,8 +334,9 @@ class TaskSimilarityService:
                 if not tasks:
                     return []
 
-                # Calculate similarities
-                results = []
+                # Prepare embeddings for batch comparison
+                embeddings = []
+                valid_tasks = []
                 for task in tasks:
                     if task.embedding:
                         # Parse embedding if stored as string
@@ -347,19 +348,25 @@ class TaskSimilarityService:
                         else:
                             embedding = task.embedding
 
-                        similarity = self.embedding_service.calculate_cosine_similarity(
-                            query_embedding,
-                            embedding
-                        )
-
-                        if similarity >= threshold:
-                            results.append({
-                                'task_id': task.id,
-                                'description': task.enriched_description or task.raw_description,
-                                'similarity': similarity,
-                                'status': task.status,
-                                'created_at': task.created_at.isoformat() if task.created_at else None
-                            })
+                        embeddings.append(embedding)
+                        valid_tasks.append(task)
+
+                # Calculate similarities in batch for efficiency
+                similarities = self.embedding_service.calculate_batch_similarities(
+                    query_embedding,
+                    embeddings
+                )
+
+                results = []
+                for task, similarity in zip(valid_tasks, similarities):
+                    if similarity >= threshold:
+                        results.append({
+                            'task_id': task.id,
+                            'description': task.enriched_description or task.raw_description,
+                            'similarity': similarity,
+                            'status': task.status,
+                            'created_at': task.created_at.isoformat() if task.created_at else None
+                        })
 
                 # Sort by similarity and limit results
                 results.sort(key=lambda x: x['similarity'], reverse=True)
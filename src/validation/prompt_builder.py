@@ -1,7 +1,7 @@
 """Build prompts for validator agents."""
 
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Mapping, Optional, List, Union
 from datetime import datetime
 
 
@@ -68,7 +68,7 @@ After checking all criteria, call mcp__hephaestus__give_validation_review with:
 
     def build_prompt(
         self,
-        task: Dict[str, Any],
+        task: Union[Mapping[str, Any], Any],
         phase_validation: Optional[Dict[str, Any]],
         commit_sha: str,
         workspace_changes: Dict[str, Any],
@@ -80,7 +80,7 @@ After checking all criteria, call mcp__hephaestus__give_validation_review with:
         """Build a validation prompt for the validator agent.
 
         Args:
-            task: Task information
+            task: Task information, as a dict or a Task model instance
             phase_validation: Validation configuration from phase YAML
             commit_sha: Commit SHA to validate
             workspace_changes: Changes made by the agent
@@ -91,6 +91,14 @@ After checking all criteria, call mcp__hephaestus__give_validation_review with:
         Returns:
             Complete prompt for validator agent
         """
+        # Format task information
+        if isinstance(task, Mapping):
+            task_id = task.get("id", "unknown")
+            task_description = task.get("enriched_description") or task.get("raw_description", "")
+        else:
+            task_id = task.id
+            task_description = task.enriched_description or task.raw_description
+
         # Format validation criteria
         validation_criteria = self._format_validation_criteria(phase_validation)
 
@@ -111,8 +119,8 @@ After checking all criteria, call mcp__hephaestus__give_validation_review with:
         # Build the prompt
         prompt = self.VALIDATOR_PROMPT_TEMPLATE.format(
             validator_agent_id=validator_agent_id or "validator-unknown",
-            task_id=task.get("id", "unknown"),
-            task_description=task.get("enriched_description") or task.get("raw_description", ""),
+            task_id=task_id,
+            task_description=task_description,
             iteration=iteration,
             previous_feedback=previous_feedback,
             validation_criteria=validation_criteria,
@@ -2,13 +2,127 @@
 
 import asyncio
 import logging
-from typing import Optional
+import os
+import subprocess
+import time
+from typing import Dict, Optional, Sequence
 import libtmux
 
 from src.interfaces import get_cli_agent
 
 logger = logging.getLogger(__name__)
 
+# Seconds between pane captures while waiting for Claude's UI
+PANE_POLL_INTERVAL = 0.1
+
+# Text Claude Code shows once its input box is ready
+CLAUDE_READY_MARKERS = ("? for shortcuts", "bypass permissions on")
+
+# Claude launch command for result validators, built on first spawn
+_RESULT_VALIDATOR_SYSTEM_PROMPT = "You are a result validation agent for the Hephaestus system."
+_RESULT_VALIDATOR_PROMPT_ID = "result_validator"
+_claude_launch_command: Optional[str] = None
+
+# Shared tmux server handle and validator sessions by agent ID
+_server: Optional[libtmux.Server] = None
+_sessions: Dict[str, libtmux.Session] = {}
+
+
+def _get_claude_launch_command() -> str:
+    """Return the Claude launch command, resolving the CLI agent only once.
+
+    The command reads its system prompt from a temp file written by
+    get_launch_command(), so it is rebuilt if that file has been removed.
+    """
+    global _claude_launch_command
+    prompt_file = f"/tmp/hep_prompt_{_RESULT_VALIDATOR_PROMPT_ID}.txt"
+    if _claude_launch_command is None or not os.path.exists(prompt_file):
+        cli_agent = get_cli_agent("claude")
+        if not cli_agent:
+            raise ValueError("Claude CLI agent not available for result validation")
+        _claude_launch_command = cli_agent.get_launch_command(
+            system_prompt=_RESULT_VALIDATOR_SYSTEM_PROMPT,
+            task_id=_RESULT_VALIDATOR_PROMPT_ID,
+        )
+    return _claude_launch_command
+
+
+def _get_server() -> libtmux.Server:
+    """Return the shared tmux server handle."""
+    global _server
+    if _server is None:
+        _server = libtmux.Server()
+    return _server
+
+
+def _find_session(agent_id: str) -> Optional[libtmux.Session]:
+    """Look up a result validator's tmux session.
+
+    Sessions created or found earlier are reused after a cheap has-session
+    check instead of scanning every tmux session again.
+    """
+    session_name = f"agent_{agent_id}"
+    server = _get_server()
+
+    session = _sessions.get(agent_id)
+    if session is not None:
+        if server.has_session(session_name):
+            return session
+        del _sessions[agent_id]
+
+    session = server.find_where({"session_name": session_name})
+    if session:
+        _sessions[agent_id] = session
+    return session
+
+
+def paste_prompt(target: str, buffer_name: str, text: str) -> None:
+    """Type text into a tmux pane in one operation via a paste buffer.
+
+    The text is loaded into a named tmux buffer and pasted with bracketed
+    paste, keeping newlines as-is (-r) so multi-line prompts are not
+    submitted line by line. The buffer is deleted after pasting.
+
+    This runs tmux subprocesses, so call it via asyncio.to_thread from
+    async code.
+
+    Args:
+        target: tmux target to paste into (a session name or pane ID)
+        buffer_name: Name of the tmux buffer to use
+        text: Text to paste (not submitted)
+    """
+    subprocess.run(
+        ["tmux", "load-buffer", "-b", buffer_name, "-"],
+        input=text.encode("utf-8"),
+        check=True,
+    )
+    subprocess.run(
+        ["tmux", "paste-buffer", "-b", buffer_name, "-d", "-p", "-r", "-t", target],
+        check=True,
+    )
+
+
+async def wait_for_pane_text(pane, markers: Sequence[str], timeout: float) -> bool:
+    """Poll a tmux pane until any of the marker strings appears.
+
+    Args:
+        pane: libtmux pane to watch
+        markers: Strings whose appearance means the pane is ready
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if a marker appeared, False if the timeout expired first
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        # capture-pane is a tmux subprocess; keep it off the event loop
+        output = "\n".join(await asyncio.to_thread(pane.capture_pane))
+        if any(marker in output for marker in markers):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(PANE_POLL_INTERVAL)
+
 
 async def spawn_result_validator_tmux_session(
     agent_id: str,
@@ -28,7 +142,7 @@ async def spawn_result_validator_tmux_session(
     """
     try:
         # Connect to tmux server
-        server = libtmux.Server()
+        server = _get_server()
 
         # Create new session for the validator
         session_name = f"agent_{agent_id}"
@@ -39,6 +153,7 @@ async def spawn_result_validator_tmux_session(
             start_directory=working_directory,
             attach=False
         )
+        _sessions[agent_id] = session
 
         # Get the default pane
         panes = list(session.panes)
@@ -48,7 +163,6 @@ async def spawn_result_validator_tmux_session(
 
         # Export PATH from current environment to ensure tmux session
         # finds the same binaries (especially claude) as the user's shell
-        import os
         current_path = os.environ.get('PATH', '')
         if current_path:
             logger.info(f"Exporting current PATH to tmux session for result validator agent {agent_id}")
@@ -61,13 +175,8 @@ async def spawn_result_validator_tmux_session(
             pane.send_keys(f"echo 'Validating result file: {result_file_path}'", enter=True)
             await asyncio.sleep(1)
 
-        # Get CLI agent command (use 'claude' for result validators)
-        cli_agent = get_cli_agent("claude")
-        if not cli_agent:
-            raise ValueError("Claude CLI agent not available for result validation")
-
-        # Start Claude Code in the session
-        claude_command = cli_agent.get_launch_command()
+        # Start Claude Code in the session (use 'claude' for result validators)
+        claude_command = _get_claude_launch_command()
         logger.info(f"Starting Claude Code with command: {claude_command}")
         pane.send_keys(claude_command, enter=True)
 
@@ -79,26 +188,23 @@ async def spawn_result_validator_tmux_session(
         #     2. Yes, I accept
         # We need to select option 2 and press Enter to accept
         logger.info(f"Waiting for Claude confirmation dialog to appear...")
-        await asyncio.sleep(3)  # Wait for dialog to fully render
+        if not await wait_for_pane_text(pane, ("Yes, I accept",), timeout=10):
+            logger.warning(f"Claude confirmation dialog not detected for {agent_id}, accepting anyway")
         # Press Down arrow to move from option 1 to option 2, then Enter to confirm
         pane.send_keys('Down', enter=False)
         await asyncio.sleep(0.2)
         pane.send_keys('', enter=True)  # Press Enter to confirm selection
         logger.info(f"Accepted Claude --dangerously-skip-permissions dialog")
 
-        # Wait for Claude to initialize
-        await asyncio.sleep(8)
+        # Wait for Claude to initialize (at most as long as the old fixed delay)
+        await wait_for_pane_text(pane, CLAUDE_READY_MARKERS, timeout=8)
 
-        # Send the validation prompt
-        lines = prompt.split('\n')
-        for line in lines:
-            if line.strip():  # Skip empty lines
-                pane.send_keys(line, enter=False)
-                await asyncio.sleep(0.1)
+        # Send the validation prompt in one paste rather than line by line
+        await asyncio.to_thread(paste_prompt, pane.pane_id, f"validator_prompt_{agent_id}", prompt)
 
-        # Send final enter to submit the prompt
+        # Send final enter to submit the prompt and wait for Claude to start on it
         pane.send_keys("", enter=True)
-        await asyncio.sleep(2)
+        await wait_for_pane_text(pane, ("esc to interrupt",), timeout=2)
 
         logger.info(f"Sent validation prompt to result validator agent {agent_id}")
         logger.debug(f"Result validation prompt preview:\n{prompt[:500]}...")
@@ -119,12 +225,12 @@ def terminate_result_validator_session(agent_id: str) -> bool:
     """
     try:
         session_name = f"agent_{agent_id}"
-        server = libtmux.Server()
 
         # Find the session
-        session = server.find_where({"session_name": session_name})
+        session = _find_session(agent_id)
         if session:
             session.kill_session()
+            _sessions.pop(agent_id, None)
             logger.info(f"Terminated result validator session: {session_name}")
             return True
         else:
@@ -151,10 +257,9 @@ def send_feedback_to_result_validator(
     """
     try:
         session_name = f"agent_{agent_id}"
-        server = libtmux.Server()
 
         # Find the session
-        session = server.find_where({"session_name": session_name})
+        session = _find_session(agent_id)
         if not session:
             logger.error(f"Result validator session not found: {session_name}")
             return False
@@ -192,10 +297,9 @@ def get_result_validator_status(agent_id: str) -> Optional[dict]:
     """
     try:
         session_name = f"agent_{agent_id}"
-        server = libtmux.Server()
 
         # Find the session
-        session = server.find_where({"session_name": session_name})
+        session = _find_session(agent_id)
         if not session:
             return None
 
@@ -1,12 +1,16 @@
 """Validator agent spawning and management."""
 
+import os
+import subprocess
 import uuid
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
-from sqlalchemy.orm import Session
+import libtmux
+from sqlalchemy.orm import Session, load_only
 
 from src.core.database import (
     DatabaseManager,
@@ -15,14 +19,44 @@ from src.core.database import (
     Phase,
     ValidationReview,
     WorktreeCommit,
-    AgentWorktree
+    AgentWorktree,
+    WorkflowResult,
+    Workflow
 )
 from src.core.worktree_manager import WorktreeManager
 from src.validation.prompt_builder import ValidationPromptBuilder
 from src.agents.manager import AgentManager
+from src.interfaces.cli_interface import CLIAgentInterface, get_cli_agent
+from src.monitoring.prompt_loader import prompt_loader
+from src.validation.result_validator_agent import CLAUDE_READY_MARKERS, paste_prompt, wait_for_pane_text
 
 logger = logging.getLogger(__name__)
 
+# Shared tmux server handle and Claude CLI agent for validator sessions
+_server: Optional[libtmux.Server] = None
+_claude_agent: Optional[CLIAgentInterface] = None
+
+# Validators being spawned or awaiting review, per (type, target, commit),
+# most recently used last. Each future resolves to the validator agent ID.
+ACTIVE_SPAWNS_SIZE = 256
+_active_spawns: "OrderedDict[Tuple[str, str, str], asyncio.Future]" = OrderedDict()
+
+
+def _get_server() -> libtmux.Server:
+    """Return the shared tmux server handle."""
+    global _server
+    if _server is None:
+        _server = libtmux.Server()
+    return _server
+
+
+def _get_claude_agent() -> CLIAgentInterface:
+    """Return the Claude CLI agent, resolving it only once."""
+    global _claude_agent
+    if _claude_agent is None:
+        _claude_agent = get_cli_agent("claude")
+    return _claude_agent
+
 
 def build_validator_prompt(
     task: Task,
@@ -49,14 +83,6 @@ def build_validator_prompt(
     """
     builder = ValidationPromptBuilder()
 
-    # Convert task to dict for prompt builder
-    task_dict = {
-        "id": task.id,
-        "raw_description": task.raw_description,
-        "enriched_description": task.enriched_description,
-        "done_definition": task.done_definition
-    }
-
     # Get phase validation config
     phase_validation = phase.validation if phase else None
 
@@ -64,7 +90,7 @@ def build_validator_prompt(
     previous_feedback = task.last_validation_feedback if iteration > 1 else None
 
     return builder.build_prompt(
-        task=task_dict,
+        task=task,
         phase_validation=phase_validation,
         commit_sha=commit_sha,
         workspace_changes=workspace_changes,
@@ -75,51 +101,41 @@ def build_validator_prompt(
     )
 
 
-async def spawn_validator_agent(
+def _prepare_validation_task(
     validation_type: str,
     target_id: str,
     workflow_id: str,
     commit_sha: str,
     db_manager: DatabaseManager,
     worktree_manager: WorktreeManager,
-    agent_manager: AgentManager,
     original_agent_id: str,
-    criteria: str = None
-) -> str:
-    """Spawn a validator agent for either task or result validation.
+    criteria: Optional[str],
+    validator_agent_id: str
+) -> Tuple[Task, str]:
+    """Load the validation target and build the validator's task and prompt.
 
-    Args:
-        validation_type: "task" or "result"
-        target_id: ID of task or result to validate
-        workflow_id: ID of the workflow
-        commit_sha: Commit SHA to validate
-        db_manager: Database manager
-        worktree_manager: Worktree manager
-        agent_manager: Agent manager
-        original_agent_id: ID of the agent that created the task/result
-        criteria: Validation criteria (for result validation)
+    This does blocking database and worktree I/O, so spawn_validator_agent
+    runs it in a worker thread.
 
     Returns:
-        ID of spawned validator agent
+        Tuple of (validation task, formatted validator prompt)
     """
-    logger.info(f"Spawning {validation_type} validator agent for {target_id}")
-
     session = db_manager.get_session()
     try:
-        # Create validator agent ID first (needed for prompt)
-        validator_agent_id = f"{validation_type}-validator-{uuid.uuid4().hex[:8]}"
-
         # Build validator prompt based on type
         if validation_type == "task":
-            # Get task and phase for task validation
-            task = session.query(Task).filter_by(id=target_id).first()
+            # Get the task, loading only the columns used below
+            task = session.query(Task).options(load_only(
+                Task.raw_description,
+                Task.done_definition,
+                Task.enriched_description,
+                Task.phase_id,
+                Task.validation_iteration,
+                Task.last_validation_feedback
+            )).filter(Task.id == target_id).first()
             if not task:
                 raise ValueError(f"Task {target_id} not found")
 
-            phase = None
-            if task.phase_id:
-                phase = session.query(Phase).filter_by(id=task.phase_id).first()
-
             # Get workspace changes
             workspace_changes = worktree_manager.get_workspace_changes(
                 agent_id=original_agent_id,
@@ -129,9 +145,6 @@ async def spawn_validator_agent(
             # Get agent claims/results
             agent_claims = get_agent_results(target_id, session)
 
-            # Build task validation prompt using the new prompt loader
-            from src.monitoring.prompt_loader import prompt_loader
-
             # Get previous feedback if any
             previous_feedback = getattr(task, 'last_validation_feedback', None)
 
@@ -167,18 +180,20 @@ async def spawn_validator_agent(
 
         elif validation_type == "result":
             # Get result and workflow for result validation
-            from src.core.database import WorkflowResult, Workflow
-            result = session.query(WorkflowResult).filter_by(id=target_id).first()
-            if not result:
+            row = session.query(WorkflowResult, Workflow).outerjoin(
+                Workflow, Workflow.id == workflow_id
+            ).options(
+                load_only(WorkflowResult.result_file_path, WorkflowResult.created_at),
+                load_only(Workflow.name)
+            ).filter(WorkflowResult.id == target_id).first()
+            if not row:
                 raise ValueError(f"Result {target_id} not found")
 
-            workflow = session.query(Workflow).filter_by(id=workflow_id).first()
+            result, workflow = row
             if not workflow:
                 raise ValueError(f"Workflow {workflow_id} not found")
 
             # Build result validation prompt using the new prompt loader
-            from src.monitoring.prompt_loader import prompt_loader
-
             validator_prompt = prompt_loader.format_result_validation_prompt(
                 validator_agent_id=validator_agent_id,
                 result_id=result.id,
@@ -208,6 +223,47 @@ async def spawn_validator_agent(
         else:
             raise ValueError(f"Invalid validation_type: {validation_type}")
 
+        return validation_task, validator_prompt
+
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+async def _spawn_new_validator_agent(
+    validation_type: str,
+    target_id: str,
+    workflow_id: str,
+    commit_sha: str,
+    db_manager: DatabaseManager,
+    worktree_manager: WorktreeManager,
+    agent_manager: AgentManager,
+    original_agent_id: str,
+    criteria: str = None
+) -> str:
+    """Spawn a validator agent; see spawn_validator_agent."""
+    logger.info(f"Spawning {validation_type} validator agent for {target_id}")
+
+    # Create validator agent ID first (needed for prompt)
+    validator_agent_id = f"{validation_type}-validator-{uuid.uuid4().hex[:8]}"
+
+    try:
+        # Database lookups run off the event loop so concurrent spawns don't block each other
+        validation_task, validator_prompt = await asyncio.to_thread(
+            _prepare_validation_task,
+            validation_type,
+            target_id,
+            workflow_id,
+            commit_sha,
+            db_manager,
+            worktree_manager,
+            original_agent_id,
+            criteria,
+            validator_agent_id
+        )
+
         # For result validators, we need the commit SHA to create worktree from
         # The commit_sha parameter should have been passed from submit_result
 
@@ -234,10 +290,141 @@ async def spawn_validator_agent(
 
     except Exception as e:
         logger.error(f"Failed to spawn {validation_type} validator agent: {e}")
-        session.rollback()
         raise
-    finally:
-        session.close()
+
+
+async def spawn_validator_agent(
+    validation_type: str,
+    target_id: str,
+    workflow_id: str,
+    commit_sha: str,
+    db_manager: DatabaseManager,
+    worktree_manager: WorktreeManager,
+    agent_manager: AgentManager,
+    original_agent_id: str,
+    criteria: str = None
+) -> str:
+    """Spawn a validator agent for either task or result validation.
+
+    Args:
+        validation_type: "task" or "result"
+        target_id: ID of task or result to validate
+        workflow_id: ID of the workflow
+        commit_sha: Commit SHA to validate
+        db_manager: Database manager
+        worktree_manager: Worktree manager
+        agent_manager: Agent manager
+        original_agent_id: ID of the agent that created the task/result
+        criteria: Validation criteria (for result validation)
+
+    Returns:
+        ID of spawned validator agent
+    """
+    spawn_args = dict(
+        validation_type=validation_type,
+        target_id=target_id,
+        workflow_id=workflow_id,
+        commit_sha=commit_sha,
+        db_manager=db_manager,
+        worktree_manager=worktree_manager,
+        agent_manager=agent_manager,
+        original_agent_id=original_agent_id,
+        criteria=criteria
+    )
+
+    # "HEAD" is not a fixed commit, so those spawns are never deduplicated
+    if commit_sha == "HEAD":
+        return await _spawn_new_validator_agent(**spawn_args)
+
+    # A repeat request for a target and commit whose validator is still being
+    # spawned or still reviewing (e.g. a flapping status update) reuses it
+    # instead of spawning another. The check and insert below have no await
+    # between them, so concurrent callers always see each other's entry.
+    spawn_key = (validation_type, target_id, commit_sha)
+    existing = _active_spawns.get(spawn_key)
+    if existing is not None:
+        _active_spawns.move_to_end(spawn_key)
+        validator_agent_id = await asyncio.shield(existing)
+        logger.info(f"Reusing {validation_type} validator agent {validator_agent_id} for {target_id} at {commit_sha}")
+        return validator_agent_id
+
+    spawned = asyncio.get_running_loop().create_future()
+    _active_spawns[spawn_key] = spawned
+    try:
+        validator_agent_id = await _spawn_new_validator_agent(**spawn_args)
+    except Exception as e:
+        if _active_spawns.get(spawn_key) is spawned:
+            del _active_spawns[spawn_key]
+        spawned.set_exception(e)
+        # Mark the exception retrieved; callers waiting on it still get it
+        spawned.exception()
+        raise
+
+    spawned.set_result(validator_agent_id)
+    if len(_active_spawns) > ACTIVE_SPAWNS_SIZE:
+        _active_spawns.popitem(last=False)
+    return validator_agent_id
+
+
+def release_validator_spawns(validation_type: str, target_id: str) -> None:
+    """Forget the validators spawned for a target once their review is in.
+
+    Called when a validator submits its review, so the next validation of
+    the same target spawns a fresh validator even at an unchanged commit.
+
+    Args:
+        validation_type: "task" or "result"
+        target_id: ID of the validated task or result
+    """
+    for key in [k for k in _active_spawns if k[0] == validation_type and k[1] == target_id]:
+        del _active_spawns[key]
+
+
+def release_validator_agent_spawns(validator_agent_id: str) -> None:
+    """Forget the spawns served by a validator agent that was terminated.
+
+    Called from AgentManager.terminate_agent, so a validator that dies or is
+    cleaned up without submitting a review is not reused for later requests.
+
+    Args:
+        validator_agent_id: ID of the terminated agent
+    """
+    for key in [
+        k for k, spawned in _active_spawns.items()
+        if spawned.done() and spawned.exception() is None and spawned.result() == validator_agent_id
+    ]:
+        del _active_spawns[key]
+
+
+def _create_tmux_pane(session_name: str, working_directory: str) -> libtmux.Pane:
+    """Create a fresh validator tmux session and return its pane.
+
+    Every libtmux call here runs a tmux subprocess, so spawn_validator_tmux_session
+    calls this in a worker thread.
+    """
+    # Use libtmux to create and manage the session
+    tmux_server = _get_server()
+
+    # Kill existing session if it exists
+    if tmux_server.has_session(session_name):
+        existing = tmux_server.get_by_id(session_name)
+        if existing:
+            existing.kill_session()
+
+    # Create new tmux session
+    tmux_session = tmux_server.new_session(
+        session_name=session_name,
+        window_name="validator",
+        start_directory=working_directory
+    )
+
+    # Get the pane
+    return tmux_session.attached_window.attached_pane
+
+
+async def _send_keys(pane: libtmux.Pane, *args, **kwargs) -> None:
+    """Run pane.send_keys (a tmux subprocess) without blocking the event loop."""
+    await asyncio.to_thread(pane.send_keys, *args, **kwargs)
 
 
 async def spawn_validator_tmux_session(
@@ -254,48 +441,26 @@ async def spawn_validator_tmux_session(
         prompt: Agent prompt
         read_only: Whether agent has read-only access
     """
-    import subprocess
-    import libtmux
-    from src.interfaces.cli_interface import get_cli_agent
-
     session_name = f"agent_{agent_id}"
 
     try:
-        # Use libtmux to create and manage the session
-        tmux_server = libtmux.Server()
-
-        # Kill existing session if it exists
-        if tmux_server.has_session(session_name):
-            existing = tmux_server.get_by_id(session_name)
-            if existing:
-                existing.kill_session()
-
-        # Create new tmux session
-        tmux_session = tmux_server.new_session(
-            session_name=session_name,
-            window_name="validator",
-            start_directory=working_directory
-        )
-
-        # Get the pane
-        pane = tmux_session.attached_window.attached_pane
+        pane = await asyncio.to_thread(_create_tmux_pane, session_name, working_directory)
 
         # Export PATH from current environment to ensure tmux session
         # finds the same binaries (especially claude) as the user's shell
-        import os
         current_path = os.environ.get('PATH', '')
         if current_path:
             logger.info(f"Exporting current PATH to tmux session for validator agent {agent_id}")
-            pane.send_keys(f'export PATH="{current_path}"', enter=True)
+            await _send_keys(pane, f'export PATH="{current_path}"', enter=True)
             await asyncio.sleep(0.2)
 
         # If read-only, show indicator (optional)
         if read_only:
-            pane.send_keys("echo 'READ-ONLY MODE: Validator agent starting...'", enter=True)
+            await _send_keys(pane, "echo 'READ-ONLY MODE: Validator agent starting...'", enter=True)
             await asyncio.sleep(1)
 
         # Get CLI agent (use 'claude' for validators)
-        cli_agent = get_cli_agent("claude")
+        cli_agent = _get_claude_agent()
 
         # Generate launch command with minimal system prompt (like normal agents)
         launch_command = cli_agent.get_launch_command(
@@ -304,7 +469,7 @@ async def spawn_validator_tmux_session(
         )
 
         # Launch Claude Code
-        pane.send_keys(launch_command, enter=True)
+        await _send_keys(pane, launch_command, enter=True)
 
         logger.info(f"Launched Claude Code for validator agent {agent_id}")
 
@@ -314,23 +479,33 @@ async def spawn_validator_tmux_session(
         #     2. Yes, I accept
         # We need to select option 2 and press Enter to accept
         logger.info(f"Waiting for Claude confirmation dialog to appear...")
-        await asyncio.sleep(3)  # Wait for dialog to fully render
+        if not await wait_for_pane_text(pane, ("Yes, I accept",), timeout=3):
+            logger.warning(f"Claude confirmation dialog not detected for {agent_id}, accepting anyway")
         # Press Down arrow to move from option 1 to option 2, then Enter to confirm
-        pane.send_keys('Down', enter=False)
+        await _send_keys(pane, 'Down', enter=False)
         await asyncio.sleep(0.2)
-        pane.send_keys('', enter=True)  # Press Enter to confirm selection
+        await _send_keys(pane, '', enter=True)  # Press Enter to confirm selection
         logger.info(f"Accepted Claude --dangerously-skip-permissions dialog")
 
-        # Wait for Claude to initialize (same as normal agents)
-        await asyncio.sleep(8)
+        # Wait for Claude to initialize (at most as long as the old fixed delay)
+        await wait_for_pane_text(pane, CLAUDE_READY_MARKERS, timeout=8)
 
-        # Send the validation prompt as an initial message
+        # Send the validation prompt as an initial message, pasted in one go
+        # rather than typed key by key
         formatted_message = cli_agent.format_message(prompt)
-        pane.send_keys(formatted_message)
+        await asyncio.to_thread(
+            paste_prompt, session_name, f"validator_prompt_{agent_id}", formatted_message
+        )
 
-        # Wait a moment then send Enter to submit the message
-        await asyncio.sleep(1)
-        pane.send_keys('', enter=True)  # Send Enter to submit
+        # Wait until the paste is on screen, then send Enter to submit it. Claude
+        # collapses a long paste to "[Pasted text #N +M lines]"; a short one
+        # shows its own text, so look for the end of the message too
+        paste_markers = ["[Pasted text"]
+        message_lines = formatted_message.strip().splitlines()
+        if message_lines:
+            paste_markers.append(message_lines[-1][-30:])
+        await wait_for_pane_text(pane, paste_markers, timeout=1)
+        await _send_keys(pane, '', enter=True)  # Send Enter to submit
 
         logger.info(f"Sent validation prompt to validator agent {agent_id}")
         logger.debug(f"Validator prompt preview:\n{prompt[:500]}...")
@@ -350,21 +525,25 @@ def get_agent_results(task_id: str, session: Session) -> str:
     Returns:
         Agent results as string
     """
-    task = session.query(Task).filter_by(id=task_id).first()
-    if not task:
+    # Only these columns are needed, so skip loading the full Task entity
+    row = session.query(
+        Task.completion_notes,
+        Task.enriched_description,
+        Task.done_definition
+    ).filter_by(id=task_id).first()
+    if not row:
         return "No task found"
 
     # Get completion notes or other results
-    results = []
-
-    if task.completion_notes:
-        results.append(f"Completion Notes: {task.completion_notes}")
-
-    if task.enriched_description:
-        results.append(f"Task Description: {task.enriched_description}")
-
-    if task.done_definition:
-        results.append(f"Done Definition: {task.done_definition}")
+    results = [
+        f"{label}: {value}"
+        for label, value in (
+            ("Completion Notes", row.completion_notes),
+            ("Task Description", row.enriched_description),
+            ("Done Definition", row.done_definition),
+        )
+        if value
+    ]
 
     # Could also fetch from agent logs or other sources
     # For now, return what we have
@@ -389,13 +568,10 @@ def send_feedback_to_agent(
     Returns:
         True if feedback sent successfully
     """
-    import subprocess
-    import tempfile
-
     session_name = f"agent_{agent_id}"
 
     try:
-        # Create feedback file
+        # Build feedback message
         feedback_content = f"""
 VALIDATION FEEDBACK (Iteration {iteration}):
 =====================================
@@ -406,15 +582,10 @@ Please address the issues above and try again.
 When ready, you can claim completion again.
 """
 
-        # Write to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(feedback_content)
-            feedback_file = f.name
-
-        # Send to tmux pane
-        cmd = f"cat {feedback_file}"
+        # Paste the feedback into the agent's pane and submit it
+        paste_prompt(session_name, f"feedback_{agent_id}", feedback_content)
         subprocess.run(
-            ["tmux", "send-keys", "-t", session_name, cmd, "Enter"],
+            ["tmux", "send-keys", "-t", session_name, "Enter"],
             check=True
         )
 
@@ -93,6 +93,24 @@ def test_config_to_env_dict():
     del os.environ["ANTHROPIC_API_KEY"]
 
 
+def test_config_to_env_dict_lowercases_overridden_flags():
+    """Test that flags set after construction keep their str().lower() form."""
+    os.environ["ANTHROPIC_API_KEY"] = "test-anthropic-key"
+
+    config = HephaestusConfig(llm_provider="anthropic")
+    config.auth_required = "True"
+    config.auto_commit = 1
+    config.enable_cors = False
+
+    env_dict = config.to_env_dict()
+
+    assert env_dict["AUTH_REQUIRED"] == "true"
+    assert env_dict["AUTO_COMMIT"] == "1"
+    assert env_dict["SERVER_ENABLE_CORS"] == "false"
+
+    del os.environ["ANTHROPIC_API_KEY"]
+
+
 def test_config_auto_sets_model():
     """Test that default model is set based on provider."""
     os.environ["OPENAI_API_KEY"] = "test-key"
@@ -0,0 +1,61 @@
+"""Tests for additive SQLite migration helper."""
+
+import sys
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.migration_utils import apply_sqlite_additive_migration
+
+
+COLUMNS = [
+    ("branch_name", "VARCHAR", None),
+    ("branch_created", "BOOLEAN", "0"),
+    ("merge_status", "VARCHAR", "'not_applicable'"),
+]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """SQLite engine with a minimal workflows table."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrate.db'}", poolclass=NullPool)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE workflows (id VARCHAR PRIMARY KEY, branch_name VARCHAR)")
+        conn.exec_driver_sql("INSERT INTO workflows (id) VALUES ('wf-1')")
+    yield engine
+    engine.dispose()
+
+
+def _columns(engine):
+    with engine.connect() as conn:
+        return {row[1]: row[4] for row in conn.exec_driver_sql("PRAGMA table_info(workflows)")}
+
+
+def test_adds_only_missing_columns(engine):
+    added = apply_sqlite_additive_migration(engine, "workflows", COLUMNS)
+
+    assert added == ["branch_created", "merge_status"]
+    columns = _columns(engine)
+    assert columns["branch_created"] == "0"
+    assert columns["merge_status"] == "'not_applicable'"
+
+
+def test_existing_rows_get_defaults(engine):
+    apply_sqlite_additive_migration(engine, "workflows", COLUMNS)
+
+    with engine.connect() as conn:
+        row = conn.exec_driver_sql(
+            "SELECT branch_created, merge_status FROM workflows WHERE id = 'wf-1'"
+        ).one()
+    assert tuple(row) == (0, "not_applicable")
+
+
+def test_rerun_is_noop(engine):
+    apply_sqlite_additive_migration(engine, "workflows", COLUMNS)
+
+    assert apply_sqlite_additive_migration(engine, "workflows", COLUMNS) == []
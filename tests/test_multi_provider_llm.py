@@ -12,6 +12,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.llm_config import (
     SimpleConfig,
+    get_config,
+    reload_config,
     MultiProviderLLMConfig,
     ModelAssignment,
     ProviderConfig
@@ -133,6 +135,63 @@ llm:
         assert guardian_assignment.openrouter_provider == "cerebras"
         assert guardian_assignment.model == "openai/gpt-oss-120b"
 
+    def test_config_cache_sidecar(self, tmp_path, monkeypatch):
+        """Test JSON sidecar cache is written, reused, and invalidated on change."""
+        monkeypatch.setenv("HEPHAESTUS_CONFIG_CACHE", "1")
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("server:\n  port: 8000\n")
+
+        assert SimpleConfig(str(config_file)).get("server.port") == 8000
+        cache_file = tmp_path / "test_config.yaml.jsoncache"
+        assert cache_file.exists()
+
+        # Changing the YAML (size differs) must bypass the stale cache
+        config_file.write_text("server:\n  port: 9001\n")
+        assert SimpleConfig(str(config_file)).get("server.port") == 9001
+
+    def test_get_dotted_keys(self, tmp_path):
+        """Test dotted-key lookups return leaves, subtrees, and defaults."""
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("server:\n  port: 9000\n  host: null\n")
+
+        config = SimpleConfig(str(config_file))
+        assert config.get("server.port") == 9000
+        assert config.get("server") == {"port": 9000, "host": None}
+        assert config.get("server.host", "0.0.0.0") == "0.0.0.0"
+        assert config.get("server.port.missing", 1) == 1
+        assert config.get("missing.key") is None
+
+    def test_get_config_cached_per_path(self, tmp_path, monkeypatch):
+        """Test get_config shares one instance per resolved path."""
+        first = tmp_path / "first.yaml"
+        second = tmp_path / "second.yaml"
+        first.write_text("server:\n  port: 8001\n")
+        second.write_text("server:\n  port: 8002\n")
+        monkeypatch.chdir(tmp_path)
+
+        config = get_config(str(first))
+        assert get_config("./first.yaml") is config
+        assert get_config(str(second)).server_port == 8002
+
+        reloaded = reload_config(str(first))
+        assert reloaded is not config
+        assert get_config(str(first)) is reloaded
+
+    def test_api_key_lookup_cached_until_reload(self, tmp_path, monkeypatch):
+        """Test API key env lookups are memoized and refreshed by load_config."""
+        monkeypatch.setenv("OPENAI_API_KEY", "first-key")
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("server:\n  port: 8000\n")
+
+        config = SimpleConfig(str(config_file))
+        assert config.get_api_key("openai") == "first-key"
+
+        monkeypatch.setenv("OPENAI_API_KEY", "second-key")
+        assert config.get_api_key("openai") == "first-key"
+
+        config.load_config()
+        assert config.get_api_key("openai") == "second-key"
+
 
 class TestLangChainLLMClient:
     """Test LangChain LLM client."""
@@ -1,5 +1,6 @@
 """Unit tests for the PromptLoader system."""
 
+import os
 import pytest
 from unittest.mock import Mock, patch, mock_open
 from pathlib import Path
@@ -83,18 +84,35 @@ class TestPromptLoader:
             with pytest.raises(ValueError, match="Prompts directory not found"):
                 PromptLoader()
 
-    def test_load_prompt_success(self, prompt_loader):
+    def test_load_prompt_success(self, prompt_loader, tmp_path):
         """Test successful prompt loading."""
         mock_content = "# Test Prompt\n\nThis is a {test} prompt with {variables}."
+        (tmp_path / "test_prompt.md").write_text(mock_content)
+        prompt_loader.prompts_dir = tmp_path
 
-        with patch('builtins.open', mock_open(read_data=mock_content)):
-            with patch('src.monitoring.prompt_loader.Path.exists', return_value=True):
-                content = prompt_loader.load_prompt("test_prompt")
+        content = prompt_loader.load_prompt("test_prompt")
 
         assert content == mock_content
         assert "{test}" in content
         assert "{variables}" in content
 
+    def test_load_prompt_cached_until_file_changes(self, prompt_loader, tmp_path):
+        """Test prompts are read once and re-read after the file is modified."""
+        prompt_file = tmp_path / "test_prompt.md"
+        prompt_file.write_text("first {version}")
+        prompt_loader.prompts_dir = tmp_path
+
+        assert prompt_loader.load_prompt("test_prompt") == "first {version}"
+
+        with patch('builtins.open', side_effect=AssertionError("prompt re-read")):
+            assert prompt_loader.load_prompt("test_prompt") == "first {version}"
+
+        prompt_file.write_text("second {version}")
+        stat = prompt_file.stat()
+        os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert prompt_loader.load_prompt("test_prompt") == "second {version}"
+
     def test_load_prompt_file_not_found(self, prompt_loader):
         """Test loading non-existent prompt file."""
         with patch('src.monitoring.prompt_loader.Path.exists', return_value=False):
@@ -0,0 +1,76 @@
+"""Unit tests for the request batchers in the Vertex AI Qdrant MCP server."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from qdrant_mcp_vertexai import EmbeddingBatcher, QdrantUpsertBatcher
+
+
+def _point(point_id):
+    return SimpleNamespace(id=point_id)
+
+
+def _embedding_client():
+    """Mock genai client whose embed_content returns one vector per content."""
+    async def embed_content(model, contents, config):
+        return SimpleNamespace(
+            embeddings=[SimpleNamespace(values=[float(len(text))]) for text in contents]
+        )
+
+    client = MagicMock()
+    client.aio.models.embed_content = AsyncMock(side_effect=embed_content)
+    return client
+
+
+async def _embed_concurrently(batcher, texts):
+    return await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(text) for text in texts)), timeout=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_embedding_batcher_sends_one_input_per_request_for_gemini():
+    """gemini-embedding-001 batches are split into single-input requests."""
+    client = _embedding_client()
+    batcher = EmbeddingBatcher(client, model="gemini-embedding-001", flush_ms=50)
+
+    results = await _embed_concurrently(batcher, ["a", "bb", "ccc"])
+
+    assert results == [[1.0], [2.0], [3.0]]
+    calls = client.aio.models.embed_content.await_args_list
+    assert sorted(call.kwargs["contents"] for call in calls) == [["a"], ["bb"], ["ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_embedding_batcher_batches_models_without_input_limit():
+    """Other models get the whole batch in one request."""
+    client = _embedding_client()
+    batcher = EmbeddingBatcher(client, model="text-embedding-005", flush_ms=50)
+
+    results = await _embed_concurrently(batcher, ["a", "bb", "ccc"])
+
+    assert results == [[1.0], [2.0], [3.0]]
+    client.aio.models.embed_content.assert_awaited_once()
+    assert client.aio.models.embed_content.await_args.kwargs["contents"] == ["a", "bb", "ccc"]
+
+
+@pytest.mark.asyncio
+async def test_upsert_batcher_fails_every_caller_on_result_count_mismatch():
+    """A batch whose results can't be matched to its items fails all callers."""
+    batcher = QdrantUpsertBatcher(MagicMock(), "memories", flush_ms=50)
+    batcher._process = AsyncMock(return_value=["p1"])
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            batcher.submit(_point("p1")),
+            batcher.submit(_point("p2")),
+            return_exceptions=True,
+        ),
+        timeout=1,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    batcher._process.assert_awaited_once()
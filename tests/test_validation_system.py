@@ -26,7 +26,9 @@ from src.validation.validator_agent import (
     build_validator_prompt,
     spawn_validator_agent,
     send_feedback_to_agent,
-    get_agent_results
+    get_agent_results,
+    release_validator_spawns,
+    release_validator_agent_spawns
 )
 
 
@@ -318,6 +320,77 @@ class TestValidatorAgent:
         session.add.assert_called()
         session.commit.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_spawn_validator_agent_reuses_recent_spawn(self):
+        """Test concurrent spawns for the same target and commit share one validator."""
+        spawn_args = dict(
+            validation_type="task",
+            target_id="task-dedupe",
+            workflow_id="wf",
+            commit_sha="abc123",
+            db_manager=Mock(),
+            worktree_manager=Mock(),
+            agent_manager=Mock(),
+            original_agent_id="agent123"
+        )
+
+        async def slow_spawn(**kwargs):
+            await asyncio.sleep(0.01)
+            return "task-validator-1234"
+
+        with patch('src.validation.validator_agent._spawn_new_validator_agent',
+                   side_effect=slow_spawn) as mock_spawn:
+            ids = await asyncio.gather(*(spawn_validator_agent(**spawn_args) for _ in range(3)))
+
+        assert ids == ["task-validator-1234"] * 3
+        assert mock_spawn.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_spawn_validator_agent_respawns_after_review(self):
+        """Test a released target gets a new validator even at the same commit."""
+        spawn_args = dict(
+            validation_type="task",
+            target_id="task-respawn",
+            workflow_id="wf",
+            commit_sha="abc123",
+            db_manager=Mock(),
+            worktree_manager=Mock(),
+            agent_manager=Mock(),
+            original_agent_id="agent123"
+        )
+
+        with patch('src.validation.validator_agent._spawn_new_validator_agent',
+                   side_effect=["task-validator-1", "task-validator-2"]) as mock_spawn:
+            first = await spawn_validator_agent(**spawn_args)
+            release_validator_spawns("task", "task-respawn")
+            second = await spawn_validator_agent(**spawn_args)
+
+        assert (first, second) == ("task-validator-1", "task-validator-2")
+        assert mock_spawn.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_spawn_validator_agent_respawns_after_validator_terminated(self):
+        """Test a target whose validator was terminated gets a new validator."""
+        spawn_args = dict(
+            validation_type="task",
+            target_id="task-terminated",
+            workflow_id="wf",
+            commit_sha="abc123",
+            db_manager=Mock(),
+            worktree_manager=Mock(),
+            agent_manager=Mock(),
+            original_agent_id="agent123"
+        )
+
+        with patch('src.validation.validator_agent._spawn_new_validator_agent',
+                   side_effect=["task-validator-1", "task-validator-2"]) as mock_spawn:
+            first = await spawn_validator_agent(**spawn_args)
+            release_validator_agent_spawns("task-validator-1")
+            second = await spawn_validator_agent(**spawn_args)
+
+        assert (first, second) == ("task-validator-1", "task-validator-2")
+        assert mock_spawn.call_count == 2
+
     def test_send_feedback_to_agent(self):
         """Test sending feedback to agent."""
         with patch('subprocess.run') as mock_run:
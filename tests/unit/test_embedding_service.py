@@ -1,9 +1,11 @@
 """Unit tests for the EmbeddingService."""
 
+import httpx
+import openai
 import pytest
 import numpy as np
 from unittest.mock import Mock, MagicMock, patch
-from src.services.embedding_service import EmbeddingService
+from src.services.embedding_service import EmbeddingService, _is_retryable_embedding_error
 
 
 class TestEmbeddingService:
@@ -16,6 +18,14 @@ class TestEmbeddingService:
             service = EmbeddingService("test-api-key")
             return service
 
+    @pytest.fixture
+    def openai_client(self, embedding_service):
+        """Mark the provider initialized with a mock OpenAI client and return the client."""
+        embedding_service._provider_ready = True
+        embedding_service._max_chars = 30000
+        embedding_service._openai_client = MagicMock()
+        return embedding_service._openai_client
+
     @pytest.fixture
     def sample_embedding(self):
         """Generate a sample embedding vector."""
@@ -25,12 +35,12 @@ class TestEmbeddingService:
         return vec.tolist()
 
     @pytest.mark.asyncio
-    async def test_generate_embedding_success(self, embedding_service, sample_embedding):
+    async def test_generate_embedding_success(self, embedding_service, openai_client, sample_embedding):
         """Test successful embedding generation returns correct dimension."""
         # Mock the OpenAI response
         mock_response = MagicMock()
         mock_response.data = [MagicMock(embedding=sample_embedding)]
-        embedding_service.client.embeddings.create = MagicMock(return_value=mock_response)
+        openai_client.embeddings.create = MagicMock(return_value=mock_response)
 
         # Generate embedding
         result = await embedding_service.generate_embedding("Test task description")
@@ -38,14 +48,13 @@ class TestEmbeddingService:
         # Verify
         assert len(result) == 3072
         assert result == sample_embedding
-        embedding_service.client.embeddings.create.assert_called_once_with(
-            model="text-embedding-3-large",
-            input="Test task description",
-            encoding_format="float"
+        openai_client.embeddings.create.assert_called_once_with(
+            model=embedding_service.model,
+            input="Test task description"
         )
 
     @pytest.mark.asyncio
-    async def test_generate_embedding_with_long_text(self, embedding_service, sample_embedding):
+    async def test_generate_embedding_with_long_text(self, embedding_service, openai_client, sample_embedding):
         """Test that long text is truncated properly."""
         # Create very long text
         long_text = "x" * 50000
@@ -53,21 +62,21 @@ class TestEmbeddingService:
         # Mock the OpenAI response
         mock_response = MagicMock()
         mock_response.data = [MagicMock(embedding=sample_embedding)]
-        embedding_service.client.embeddings.create = MagicMock(return_value=mock_response)
+        openai_client.embeddings.create = MagicMock(return_value=mock_response)
 
         # Generate embedding
         result = await embedding_service.generate_embedding(long_text)
 
         # Verify text was truncated
-        call_args = embedding_service.client.embeddings.create.call_args
+        call_args = openai_client.embeddings.create.call_args
         assert len(call_args[1]['input']) == 30000  # Max chars limit
         assert len(result) == 3072
 
     @pytest.mark.asyncio
-    async def test_generate_embedding_api_error(self, embedding_service):
+    async def test_generate_embedding_api_error(self, embedding_service, openai_client):
         """Test error handling for API failures."""
         # Mock API error
-        embedding_service.client.embeddings.create = MagicMock(
+        openai_client.embeddings.create = MagicMock(
             side_effect=Exception("API Error")
         )
 
@@ -76,6 +85,118 @@ class TestEmbeddingService:
             await embedding_service.generate_embedding("Test text")
         assert "API Error" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_generate_embedding_does_not_retry_local_errors(self, embedding_service, openai_client):
+        """Test deterministic failures are raised without retrying."""
+        openai_client.embeddings.create = MagicMock(
+            side_effect=ValueError("bad input")
+        )
+
+        with pytest.raises(ValueError):
+            await embedding_service.generate_embedding("Test text")
+        assert openai_client.embeddings.create.call_count == 1
+
+    def test_retryable_embedding_errors(self):
+        """Test only transient provider errors are classified as retryable."""
+        request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+
+        def status_error(cls, code):
+            return cls("error", response=httpx.Response(code, request=request), body=None)
+
+        assert _is_retryable_embedding_error(openai.APIConnectionError(request=request))
+        assert _is_retryable_embedding_error(status_error(openai.RateLimitError, 429))
+        assert _is_retryable_embedding_error(status_error(openai.InternalServerError, 503))
+        assert _is_retryable_embedding_error(RuntimeError("provider unavailable"))
+        assert not _is_retryable_embedding_error(status_error(openai.BadRequestError, 400))
+        assert not _is_retryable_embedding_error(status_error(openai.AuthenticationError, 401))
+        assert not _is_retryable_embedding_error(TypeError("bug"))
+
+    @pytest.mark.asyncio
+    async def test_provider_initialized_on_first_use(self, sample_embedding):
+        """Test the provider client is only created when an embedding is requested."""
+        with patch('src.services.embedding_service.openai.OpenAI') as mock_openai:
+            service = EmbeddingService("test-api-key")
+            service.embedding_provider = "openai"
+            service.calculate_cosine_similarity([1.0, 0.0], [0.0, 1.0])
+            mock_openai.assert_not_called()
+
+            mock_response = MagicMock()
+            mock_response.data = [MagicMock(embedding=sample_embedding)]
+            mock_openai.return_value.embeddings.create.return_value = mock_response
+            await service.generate_embedding("Test task description")
+            await service.generate_embedding("Another task description")
+
+        mock_openai.assert_called_once_with(api_key="test-api-key")
+
+    @pytest.mark.asyncio
+    async def test_generate_embedding_cached_by_content(self, embedding_service, openai_client, sample_embedding):
+        """Test identical texts reuse the cached embedding."""
+        mock_response = MagicMock()
+        mock_response.data = [MagicMock(embedding=sample_embedding)]
+        openai_client.embeddings.create = MagicMock(return_value=mock_response)
+
+        first = await embedding_service.generate_embedding("Same ticket text")
+        second = await embedding_service.generate_embedding("Same ticket text")
+        await embedding_service.generate_embedding("Different ticket text")
+
+        assert first == second == sample_embedding
+        assert openai_client.embeddings.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_batch_single_request(self, embedding_service, openai_client):
+        """Test batch embedding issues one request and keeps input order."""
+        mock_response = MagicMock()
+        mock_response.data = [
+            MagicMock(index=1, embedding=[0.0, 1.0]),
+            MagicMock(index=0, embedding=[1.0, 0.0]),
+        ]
+        openai_client.embeddings.create = MagicMock(return_value=mock_response)
+
+        result = await embedding_service.generate_embeddings_batch(["first", "second"])
+
+        assert result == [[1.0, 0.0], [0.0, 1.0]]
+        openai_client.embeddings.create.assert_called_once()
+        call_kwargs = openai_client.embeddings.create.call_args.kwargs
+        assert call_kwargs["input"] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_generate_ticket_embedding_weighted_parts(self, embedding_service, openai_client):
+        """Test ticket parts are embedded in one request and combined by weight."""
+        mock_response = MagicMock()
+        mock_response.data = [
+            MagicMock(index=0, embedding=[1.0, 0.0, 0.0]),
+            MagicMock(index=1, embedding=[0.0, 1.0, 0.0]),
+            MagicMock(index=2, embedding=[0.0, 0.0, 1.0]),
+        ]
+        openai_client.embeddings.create = MagicMock(return_value=mock_response)
+
+        result = await embedding_service.generate_ticket_embedding(
+            "Fix login", "OAuth times out", ["backend", "auth"]
+        )
+
+        expected = np.array([2.0, 1.0, 1.5]) / np.linalg.norm([2.0, 1.0, 1.5])
+        assert np.allclose(result, expected)
+        call_kwargs = openai_client.embeddings.create.call_args.kwargs
+        assert call_kwargs["input"] == ["Fix login", "OAuth times out", "backend auth"]
+
+        # Only the edited description is re-embedded
+        mock_response.data = [MagicMock(index=0, embedding=[0.0, 1.0, 0.0])]
+        await embedding_service.generate_ticket_embedding(
+            "Fix login", "OAuth login times out", ["backend", "auth"]
+        )
+        call_kwargs = openai_client.embeddings.create.call_args.kwargs
+        assert call_kwargs["input"] == ["OAuth login times out"]
+
+    @pytest.mark.asyncio
+    async def test_generate_ticket_embedding_all_parts_empty(self, embedding_service, openai_client):
+        """Test a ticket with no text gets a zero vector without an API call."""
+
+        result = await embedding_service.generate_ticket_embedding("  ", "", [])
+
+        assert len(result) == 3072
+        assert not any(result)
+        openai_client.embeddings.create.assert_not_called()
+
     def test_cosine_similarity_identical_vectors(self, embedding_service):
         """Test cosine similarity of identical vectors returns 1.0."""
         vec = [1.0, 2.0, 3.0, 4.0, 5.0]
@@ -118,6 +239,14 @@ class TestEmbeddingService:
         similarity = embedding_service.calculate_cosine_similarity(vec1, vec2)
         assert similarity == 0.0
 
+    def test_cosine_similarity_scalar_path_matches_numpy(self, embedding_service):
+        """Test short vectors give the same score as the numpy path."""
+        vec1 = np.random.randn(32).tolist()
+        vec2 = np.random.randn(32).tolist()
+        similarity = embedding_service.calculate_cosine_similarity(vec1, vec2)
+        expected = np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
+        assert abs(similarity - expected) < 1e-6
+
     def test_calculate_batch_similarities_empty(self, embedding_service):
         """Test batch similarity calculation with empty embeddings."""
         query = [1.0, 2.0, 3.0]
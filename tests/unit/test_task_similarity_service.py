@@ -352,6 +352,30 @@ class TestTaskSimilarityService:
         embeddings_arg = mock_embedding_service.calculate_batch_similarities.call_args[0][1]
         assert embeddings_arg[0] == [0.1] * 3072
 
+    @pytest.mark.asyncio
+    async def test_find_similar_tasks_batches_similarities(self, similarity_service, mock_db_manager, mock_embedding_service):
+        """Test that similar-task search scores all tasks in one batch."""
+        _, session = mock_db_manager
+
+        tasks = [
+            Mock(id=f"task-{i}", enriched_description=f"Task {i}", status="done", created_at=None)
+            for i in range(3)
+        ]
+        tasks[0].embedding = [0.1] * 3072
+        tasks[1].embedding = "not json"  # Skipped
+        tasks[2].embedding = json.dumps([0.2] * 3072)
+
+        session.query().filter().all.return_value = tasks
+        mock_embedding_service.generate_embedding.return_value = [0.5] * 3072
+        mock_embedding_service.calculate_batch_similarities.return_value = [0.2, 0.8]
+
+        results = await similarity_service.find_similar_tasks("query", threshold=0.3)
+
+        mock_embedding_service.calculate_batch_similarities.assert_called_once()
+        embeddings_arg = mock_embedding_service.calculate_batch_similarities.call_args[0][1]
+        assert embeddings_arg == [[0.1] * 3072, [0.2] * 3072]
+        assert [r['task_id'] for r in results] == ["task-2"]
+
     @pytest.mark.asyncio
     async def test_error_handling_returns_safe_default(self, similarity_service, mock_db_manager):
         """Test that errors return safe defaults."""